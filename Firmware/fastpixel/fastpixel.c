@@ -0,0 +1,53 @@
+// Natives MicroPython-Modul für den Pixel-Fill-Hotpath des ILI9341-Treibers.
+// Bauen mit `make` (siehe Makefile), fastpixel.mpy neben ili9341_test.py
+// auf den Pico kopieren. Fehlt das Modul, nutzt der Treiber den Viper-Pfad.
+#include "py/dynruntime.h"
+
+// fill_u16_be(buf, color[, count]): count Pixel als big-endian RGB565 in buf schreiben
+static mp_obj_t fill_u16_be(size_t n_args, const mp_obj_t *args) {
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(args[0], &bufinfo, MP_BUFFER_WRITE);
+    mp_uint_t color = mp_obj_get_int(args[1]);
+    size_t count = bufinfo.len / 2;
+    if (n_args > 2) {
+        mp_int_t n = mp_obj_get_int(args[2]);
+        if (n < 0) {
+            n = 0;
+        }
+        if ((size_t)n < count) {
+            count = n;
+        }
+    }
+
+    uint8_t hi = (color >> 8) & 0xFF;
+    uint8_t lo = color & 0xFF;
+    uint8_t *p = bufinfo.buf;
+
+    // Bis zur Wortgrenze paarweise schreiben, danach zwei Pixel pro 32-Bit-Store
+    while (count && ((uintptr_t)p & 3)) {
+        p[0] = hi;
+        p[1] = lo;
+        p += 2;
+        count--;
+    }
+    uint32_t pattern = hi | (lo << 8) | (hi << 16) | ((uint32_t)lo << 24);
+    uint32_t *w = (uint32_t *)p;
+    for (size_t i = count >> 1; i; i--) {
+        *w++ = pattern;
+    }
+    if (count & 1) {
+        p = (uint8_t *)w;
+        p[0] = hi;
+        p[1] = lo;
+    }
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(fill_u16_be_obj, 2, 3, fill_u16_be);
+
+mp_obj_t mpy_init(mp_obj_fun_bc_t *self, size_t n_args, size_t n_kw, mp_obj_t *args) {
+    MP_DYNRUNTIME_INIT_ENTRY
+
+    mp_store_global(MP_QSTR_fill_u16_be, MP_OBJ_FROM_PTR(&fill_u16_be_obj));
+
+    MP_DYNRUNTIME_INIT_EXIT
+}
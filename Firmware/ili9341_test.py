@@ -1,7 +1,15 @@
 import machine
 import time
+import micropython
 from micropython import const
 import ustruct as struct
+from array import array
+
+try:
+    # Optionales natives Modul (siehe fastpixel/), sonst Viper-Fallback
+    from fastpixel import fill_u16_be as _fill_native
+except ImportError:
+    _fill_native = None
 
 # ILI9341 commands - spezifisch für TPM408-2.8
 ILI9341_SWRESET = const(0x01)
@@ -77,28 +85,168 @@ WHITE = const(0xFFFF)
 _ENCODE_PIXEL = ">H"
 _ENCODE_POS = ">HH"
 
+_CHUNK_PIXELS = const(512)
+
+# RP2040 SPI-Register für DMA-Transfers (PL022)
+_SPI_BASE = (0x4003C000, 0x40040000)
+_DREQ_SPI_TX = (16, 18)
+_SSPCR0 = const(0x00)
+_SSPCR1 = const(0x04)
+_SSPDR = const(0x08)
+_SSPSR = const(0x0C)
+_SSPICR = const(0x20)
+_SSPSR_RNE = const(0x04)
+_SSPSR_BSY = const(0x10)
+_SSPICR_RORIC = const(0x01)
+_SSPCR0_DSS = const(0x0F)
+_SSPCR1_SSE = const(0x02)
+
+# PIO-Register für den Stall-Check des PIO-SPI-Senders
+_PIO_BASE = (0x50200000, 0x50300000)
+_PIO_FDEBUG = const(0x08)
+_FDEBUG_TXSTALL = const(24)
+
+try:
+    import rp2
+except ImportError:
+    rp2 = None
+
+_DEBUG = const(0)
+# Displaydaten über PIO statt Hardware-SPI senden (optional, fill_rect_async und
+# Test 5 laufen dann ohne DMA über den synchronen Fallback)
+_USE_PIO_SPI = const(0)
+
+# Init-Sequenz: (Kommando, Daten, Wartezeit in ms)
+_INIT_SEQ = (
+    # Nach SWRESET reichen laut Datenblatt 5 ms bis zum nächsten Kommando,
+    # nach SLPOUT genügen einmalig 120 ms (zweites SLPOUT entfällt)
+    (ILI9341_SWRESET, None, 5),                           # Software Reset
+    (ILI9341_SLPOUT, None, 120),                          # Exit Sleep Mode
+    (0xCB, b"\x39\x2C\x00\x34\x02", 0),                   # Power Control A
+    (0xCF, b"\x00\xC1\x30", 0),                           # Power Control B
+    (0xE8, b"\x85\x00\x78", 0),                           # Driver Timing Control A
+    (0xEA, b"\x00\x00", 0),                               # Driver Timing Control B
+    (0xED, b"\x64\x03\x12\x81", 0),                       # Power on Sequence Control
+    (0xF7, b"\x20", 0),                                   # Pump Ratio Control
+    (ILI9341_PWCTR1, b"\x23", 0),                         # Power Control 1
+    (ILI9341_PWCTR2, b"\x10", 0),                         # Power Control 2
+    (ILI9341_VMCTR1, b"\x3E\x28", 0),                     # VCOM Control 1
+    (ILI9341_VMCTR2, b"\x86", 0),                         # VCOM Control 2
+    (ILI9341_MADCTL, bytes((MADCTL_MX | MADCTL_BGR,)), 0),  # Memory Access Control
+    (ILI9341_PIXFMT, b"\x55", 0),                         # Pixel Format Set: 16 bit
+    (ILI9341_FRMCTR1, b"\x00\x18", 0),                    # Frame Rate Control
+    (ILI9341_DFUNCTR, b"\x08\x82\x27", 0),                # Display Function Control
+    (ILI9341_GAMMASET, b"\x01", 0),                       # Gamma Set
+    (ILI9341_GMCTRP1, b"\x0F\x31\x2B\x0C\x0E\x08\x4E\xF1"
+                      b"\x37\x07\x10\x03\x0E\x09\x00", 0),  # Positive Gamma Correction
+    (ILI9341_GMCTRN1, b"\x00\x0E\x14\x03\x11\x07\x31\xC1"
+                      b"\x48\x08\x0F\x0C\x31\x36\x0F", 0),  # Negative Gamma Correction
+    (ILI9341_DISPON, None, 100),                          # Display On
+)
+
 
 def delay_ms(ms):
     time.sleep_ms(ms)
 
 
-def color565(r, g=0, b=0):
+@micropython.viper
+def color565(r: int, g: int, b: int) -> int:
     """Convert red, green and blue values (0-255) into a 16-bit 565 encoding."""
+    return ((r & 0xf8) << 8) | ((g & 0xfc) << 3) | (b >> 3)
+
+
+@micropython.viper
+def _fill_u16_be(buf: ptr8, count: int, hi: int, lo: int):
+    """Write count big-endian 16-bit pixels (hi, lo) into buf"""
+    i = 0
+    while i < count:
+        buf[2 * i] = hi
+        buf[2 * i + 1] = lo
+        i += 1
+
+
+def color565_any(r, g=0, b=0):
+    """Like color565, but also accepts a single (r, g, b) tuple/list."""
     try:
         r, g, b = r  # see if the first var is a tuple/list
     except TypeError:
         pass
-    return (r & 0xf8) << 8 | (g & 0xfc) << 3 | b >> 3
+    return color565(r, g, b)
+
+
+if rp2:
+    # SPI Mode 0, MSB zuerst: Datenbit bei SCK low ausgeben, bei SCK high übernehmen
+    @rp2.asm_pio(out_init=rp2.PIO.OUT_LOW, sideset_init=rp2.PIO.OUT_LOW,
+                 out_shiftdir=rp2.PIO.SHIFT_LEFT, autopull=True, pull_thresh=8)
+    def _spi_tx_pio():
+        out(pins, 1).side(0)
+        nop().side(1)
+
+
+class PioSpiTx:
+    """Transmit-only SPI on a PIO state machine, drop-in for spi.write"""
+
+    def __init__(self, sm_id, sck, mosi, baudrate=20000000):
+        # Zwei PIO-Takte pro Bit, Bytes ohne Pause zwischen den Frames
+        self._sm = rp2.StateMachine(sm_id, _spi_tx_pio, freq=2 * baudrate,
+                                    out_base=mosi, sideset_base=sck)
+        self._sm.active(1)
+        self._fdebug = _PIO_BASE[sm_id >> 2] + _PIO_FDEBUG
+        self._stall = 1 << (_FDEBUG_TXSTALL + (sm_id & 3))
+
+    def write(self, buf):
+        """Send buf and return once the last bit has left the pin"""
+        sm = self._sm
+        sm.put(buf, 24)
+        while sm.tx_fifo():
+            pass
+        # TXSTALL wird gesetzt, sobald das letzte Byte aus dem OSR geschoben ist
+        fdebug = self._fdebug
+        machine.mem32[fdebug] = self._stall
+        while not machine.mem32[fdebug] & self._stall:
+            pass
 
 
 class ILI9341:
-    def __init__(self, spi, dc, reset, cs=None, width=320, height=240):
+    def __init__(self, spi, dc, reset, cs=None, width=320, height=240, spi_id=None):
         self.spi = spi
         self.dc = dc
         self.reset = reset
         self.cs = cs
         self.width = width
         self.height = height
+        # Einmal allokierter Pixelpuffer für fill_rect (mindestens eine Zeile)
+        self._line_buf = bytearray(max(width, _CHUNK_PIXELS) * 2)
+        self._line_mv = memoryview(self._line_buf)
+        # Vorgefertigter Fensterblock: CASET x0 x1 | PASET y0 y1 | RAMWR,
+        # pro Aufruf werden nur die Koordinaten-Bytes überschrieben
+        self._win_buf = bytearray(11)
+        self._win_buf[0] = ILI9341_CASET
+        self._win_buf[5] = ILI9341_PASET
+        self._win_buf[10] = ILI9341_RAMWR
+        win = memoryview(self._win_buf)
+        self._win_parts = (win[0:1], win[1:5], win[5:6], win[6:10], win[10:11])
+        # Scratch-Puffer für Einzelpixel
+        self._pix_buf = bytearray(2)
+        self._b1 = bytearray(1)
+        self._mv1 = memoryview(self._b1)
+        # Optionaler DMA-Kanal für fill_rect_async (nur Hardware-SPI auf RP2040)
+        self._dma = None
+        self._dma_busy = False
+        if spi_id is not None:
+            try:
+                self._dma = rp2.DMA()
+            except (AttributeError, OSError):
+                self._dma = None
+        if self._dma:
+            self._spi_base = _SPI_BASE[spi_id]
+            # 16-Bit-Transfers ohne Lese-Inkrement: ein FIFO-Eintrag pro Pixel,
+            # die Pixelfarbe wird endlos wiederholt
+            self._dma_ctrl = self._dma.pack_ctrl(size=1, inc_read=False, inc_write=False,
+                                                 treq_sel=_DREQ_SPI_TX[spi_id])
+            # Farbe als natives Halbwort: im 16-Bit-Modus sendet die SPI das
+            # obere Byte zuerst, also ohne Umpacken RGB565 big-endian
+            self._dma_pix = array("H", (0,))
 
     def dc_low(self):
         self.dc.off()
@@ -122,39 +270,55 @@ class ILI9341:
         if self.cs:
             self.cs.on()
 
-    def write_cmd(self, cmd):
-        """Write command"""
+    def _tx_begin(self):
+        """Start SPI transaction (CS low)"""
+        if self._dma_busy:
+            self.wait()
         self.cs_low()
-        self.dc_low()
-        self.spi.write(bytes([cmd]))
+
+    def _tx_end(self):
+        """End SPI transaction (CS high)"""
         self.cs_high()
 
-    def write_data(self, data):
-        """Write data"""
-        self.cs_low()
+    def _cmd_nocs(self, cmd):
+        """Write command byte inside an open transaction"""
+        self._b1[0] = cmd
+        self.dc_low()
+        self.spi.write(self._mv1)
+
+    def _data_nocs(self, data):
+        """Write data inside an open transaction"""
         self.dc_high()
         if isinstance(data, int):
-            self.spi.write(bytes([data]))
+            self._b1[0] = data
+            self.spi.write(self._mv1)
         else:
             self.spi.write(data)
-        self.cs_high()
+
+    def write_cmd(self, cmd):
+        """Write command"""
+        self._tx_begin()
+        self._cmd_nocs(cmd)
+        self._tx_end()
+
+    def write_data(self, data):
+        """Write data"""
+        self._tx_begin()
+        self._data_nocs(data)
+        self._tx_end()
 
     def write_cmd_data(self, cmd, data=None):
         """Write command followed by data"""
-        self.cs_low()
-        self.dc_low()
-        self.spi.write(bytes([cmd]))
+        self._tx_begin()
+        self._cmd_nocs(cmd)
         if data is not None:
-            self.dc_high()
-            if isinstance(data, int):
-                self.spi.write(bytes([data]))
-            else:
-                self.spi.write(data)
-        self.cs_high()
+            self._data_nocs(data)
+        self._tx_end()
 
     def hard_reset(self):
         """Hardware reset sequence"""
-        print("Hardware Reset...")
+        if _DEBUG:
+            print("Hardware Reset...")
         if self.reset:
             self.reset_high()
             delay_ms(10)
@@ -165,121 +329,67 @@ class ILI9341:
 
     def init(self):
         """Initialize ILI9341 display"""
-        print("Initialisiere ILI9341...")
+        if _DEBUG:
+            print("Initialisiere ILI9341...")
         
         # Hardware Reset
         self.hard_reset()
         
-        # Software Reset
-        print("Software Reset...")
-        self.write_cmd(ILI9341_SWRESET)
-        delay_ms(150)
-        
-        # Exit Sleep Mode
-        print("Exit Sleep Mode...")
-        self.write_cmd(ILI9341_SLPOUT)
-        delay_ms(120)
-        
-        # Power Control A
-        print("Power Control A...")
-        self.write_cmd_data(0xCB, bytes([0x39, 0x2C, 0x00, 0x34, 0x02]))
-        
-        # Power Control B
-        print("Power Control B...")
-        self.write_cmd_data(0xCF, bytes([0x00, 0xC1, 0x30]))
-        
-        # Driver Timing Control A
-        print("Driver Timing Control A...")
-        self.write_cmd_data(0xE8, bytes([0x85, 0x00, 0x78]))
-        
-        # Driver Timing Control B
-        print("Driver Timing Control B...")
-        self.write_cmd_data(0xEA, bytes([0x00, 0x00]))
-        
-        # Power on Sequence Control
-        print("Power on Sequence Control...")
-        self.write_cmd_data(0xED, bytes([0x64, 0x03, 0x12, 0x81]))
-        
-        # Pump Ratio Control
-        print("Pump Ratio Control...")
-        self.write_cmd_data(0xF7, 0x20)
-        
-        # Power Control 1
-        print("Power Control 1...")
-        self.write_cmd_data(ILI9341_PWCTR1, 0x23)
-        
-        # Power Control 2
-        print("Power Control 2...")
-        self.write_cmd_data(ILI9341_PWCTR2, 0x10)
-        
-        # VCOM Control 1
-        print("VCOM Control 1...")
-        self.write_cmd_data(ILI9341_VMCTR1, bytes([0x3e, 0x28]))
-        
-        # VCOM Control 2
-        print("VCOM Control 2...")
-        self.write_cmd_data(ILI9341_VMCTR2, 0x86)
-        
-        # Memory Access Control
-        print("Memory Access Control...")
-        self.write_cmd_data(ILI9341_MADCTL, MADCTL_MX | MADCTL_BGR)
-        
-        # Pixel Format Set
-        print("Pixel Format Set...")
-        self.write_cmd_data(ILI9341_PIXFMT, 0x55)  # 16 bit
-        
-        # Frame Rate Control
-        print("Frame Rate Control...")
-        self.write_cmd_data(ILI9341_FRMCTR1, bytes([0x00, 0x18]))
-        
-        # Display Function Control
-        print("Display Function Control...")
-        self.write_cmd_data(ILI9341_DFUNCTR, bytes([0x08, 0x82, 0x27]))
-        
-        # Gamma Set
-        print("Gamma Set...")
-        self.write_cmd_data(ILI9341_GAMMASET, 0x01)
-        
-        # Positive Gamma Correction
-        print("Positive Gamma Correction...")
-        self.write_cmd_data(ILI9341_GMCTRP1, bytes([
-            0x0F, 0x31, 0x2B, 0x0C, 0x0E, 0x08, 0x4E, 0xF1,
-            0x37, 0x07, 0x10, 0x03, 0x0E, 0x09, 0x00
-        ]))
-        
-        # Negative Gamma Correction
-        print("Negative Gamma Correction...")
-        self.write_cmd_data(ILI9341_GMCTRN1, bytes([
-            0x00, 0x0E, 0x14, 0x03, 0x11, 0x07, 0x31, 0xC1,
-            0x48, 0x08, 0x0F, 0x0C, 0x31, 0x36, 0x0F
-        ]))
-        
-        # Sleep Out
-        print("Sleep Out...")
-        self.write_cmd(ILI9341_SLPOUT)
-        delay_ms(120)
-        
-        # Display On
-        print("Display On...")
-        self.write_cmd(ILI9341_DISPON)
-        delay_ms(100)
+        write_cmd = self.write_cmd
+        write_cmd_data = self.write_cmd_data
+        for cmd, data, ms in _INIT_SEQ:
+            if _DEBUG:
+                print("CMD 0x%02X" % cmd)
+            if data:
+                write_cmd_data(cmd, data)
+            else:
+                write_cmd(cmd)
+            if ms:
+                delay_ms(ms)
         
-        print("ILI9341 Initialisierung abgeschlossen!")
+        if _DEBUG:
+            print("ILI9341 Initialisierung abgeschlossen!")
 
     def set_window(self, x0, y0, x1, y1):
         """Set display window"""
+        self._tx_begin()
+        self._set_window_nocs(x0, y0, x1, y1)
+        self._tx_end()
+
+    def _set_window_nocs(self, x0, y0, x1, y1):
+        """Set display window inside an open transaction"""
+        pack_into = struct.pack_into
+        pack_into(_ENCODE_POS, self._win_buf, 1, x0, x1)
+        pack_into(_ENCODE_POS, self._win_buf, 6, y0, y1)
+        caset, cols, paset, rows, ramwr = self._win_parts
+        dc = self.dc
+        write = self.spi.write
         # Column Address Set
-        self.write_cmd_data(ILI9341_CASET, struct.pack(">HH", x0, x1))
+        dc.off()
+        write(caset)
+        dc.on()
+        write(cols)
         # Page Address Set
-        self.write_cmd_data(ILI9341_PASET, struct.pack(">HH", y0, y1))
+        dc.off()
+        write(paset)
+        dc.on()
+        write(rows)
         # Memory Write
-        self.write_cmd(ILI9341_RAMWR)
+        dc.off()
+        write(ramwr)
 
     def pixel(self, x, y, color):
         """Set single pixel"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.set_window(x, y, x, y)
-            self.write_data(struct.pack(">H", color))
+            self._pixel_unchecked(x, y, color)
+
+    def _pixel_unchecked(self, x, y, color):
+        """Set single pixel, caller guarantees it is on screen"""
+        struct.pack_into(_ENCODE_PIXEL, self._pix_buf, 0, color)
+        self._tx_begin()
+        self._set_window_nocs(x, y, x, y)
+        self._data_nocs(self._pix_buf)
+        self._tx_end()
 
     def fill_rect(self, x, y, w, h, color):
         """Fill rectangle with color"""
@@ -288,17 +398,95 @@ class ILI9341:
         if y + h > self.height:
             h = self.height - y
         
-        self.set_window(x, y, x + w - 1, y + h - 1)
-        
-        # Send color data
-        pixel_data = struct.pack(">H", color)
+        if w <= 0 or h <= 0:
+            return
+        self._fill_rect_unchecked(x, y, w, h, color)
+
+    def _fill_rect_unchecked(self, x, y, w, h, color):
+        """Fill rectangle, caller guarantees it is non-empty and on screen"""
+        total_pixels = w * h
+        n = min(total_pixels, _CHUNK_PIXELS) * 2
+        self._fill_line_buf(color, n)
+        chunk = self._line_mv[:n]
+        full, rem = divmod(total_pixels * 2, n)
+        
+        # Fenster + Farbdaten in einer einzigen CS-Phase senden
+        self._tx_begin()
+        self._set_window_nocs(x, y, x + w - 1, y + h - 1)
+        self.dc_high()
+        write = self.spi.write
+        for _ in range(full):
+            write(chunk)
+        if rem:
+            write(self._line_mv[:rem])
+        self._tx_end()
+
+    def blit_buffer(self, buf, x, y, w, h):
+        """Write pre-rendered big-endian 565 pixels (w*h*2 bytes) to a window"""
+        # Ein Vollbild bräuchte 320*240*2 = 153,6 KB - auf dem Pico besser
+        # zeilen- (320*2 = 640 B) oder kachelweise blitten
+        self._tx_begin()
+        self._set_window_nocs(x, y, x + w - 1, y + h - 1)
+        self._data_nocs(buf)
+        self._tx_end()
+
+    def fill_rect_async(self, x, y, w, h, color):
+        """Fill rectangle via DMA; returns immediately, join with wait()"""
+        if not self._dma:
+            self.fill_rect(x, y, w, h, color)
+            return
+        if x + w > self.width:
+            w = self.width - x
+        if y + h > self.height:
+            h = self.height - y
+        # Beide Maße prüfen: zwei negative Maße ergäben ein positives Produkt
+        if w <= 0 or h <= 0:
+            return
         total_pixels = w * h
         
-        self.cs_low()
+        self._tx_begin()
+        self._set_window_nocs(x, y, x + w - 1, y + h - 1)
         self.dc_high()
-        for _ in range(total_pixels):
-            self.spi.write(pixel_data)
-        self.cs_high()
+        self._dma_pix[0] = color
+        self._spi_frame_bits(16)
+        self._dma.config(read=self._dma_pix, write=self._spi_base + _SSPDR,
+                         count=total_pixels, ctrl=self._dma_ctrl, trigger=True)
+        # CS bleibt low bis wait() den Transfer abschließt
+        self._dma_busy = True
+
+    def wait(self):
+        """Block until a pending fill_rect_async transfer has finished"""
+        if not self._dma_busy:
+            return
+        while self._dma.active():
+            pass
+        sr = self._spi_base + _SSPSR
+        while machine.mem32[sr] & _SSPSR_BSY:
+            pass
+        # Vom DMA nicht gelesene RX-Bytes verwerfen und Overrun-Flag löschen
+        dr = self._spi_base + _SSPDR
+        while machine.mem32[sr] & _SSPSR_RNE:
+            machine.mem32[dr]
+        machine.mem32[self._spi_base + _SSPICR] = _SSPICR_RORIC
+        self._spi_frame_bits(8)
+        self._dma_busy = False
+        self._tx_end()
+
+    def _spi_frame_bits(self, bits):
+        """Switch the PL022 frame size (commands must stay 8 bit)"""
+        cr0 = self._spi_base + _SSPCR0
+        cr1 = self._spi_base + _SSPCR1
+        sse = machine.mem32[cr1] & _SSPCR1_SSE
+        machine.mem32[cr1] &= ~_SSPCR1_SSE
+        machine.mem32[cr0] = (machine.mem32[cr0] & ~_SSPCR0_DSS) | (bits - 1)
+        machine.mem32[cr1] |= sse
+
+    def _fill_line_buf(self, color, n):
+        """Fill the first n bytes of the line buffer with color"""
+        if _fill_native:
+            _fill_native(self._line_buf, color, n >> 1)
+        else:
+            _fill_u16_be(self._line_buf, n >> 1, (color >> 8) & 0xFF, color & 0xFF)
 
     def fill(self, color):
         """Fill entire screen with color"""
@@ -313,7 +501,7 @@ class ILI9341:
         self.fill_rect(x, y, 1, h, color)
 
     def line(self, x0, y0, x1, y1, color):
-        """Draw line using Bresenham algorithm"""
+        """Draw line using Bresenham algorithm, one fill_rect per straight run"""
         steep = abs(y1 - y0) > abs(x1 - x0)
         if steep:
             x0, y0 = y0, x0
@@ -326,17 +514,56 @@ class ILI9341:
         err = dx // 2
         ystep = 1 if y0 < y1 else -1
         
+        # Liegt die Linie komplett im Bild, entfällt das Clipping pro Lauf
+        if steep:
+            limit_a, limit_b = self.height, self.width
+        else:
+            limit_a, limit_b = self.width, self.height
+        if 0 <= x0 and x1 < limit_a and 0 <= y0 < limit_b and 0 <= y1 < limit_b:
+            run = self._line_span
+        else:
+            run = self._line_run
+        
+        # Pixel mit gleicher Nebenachse zu einem Lauf zusammenfassen
+        run_start = x0
         while x0 <= x1:
-            if steep:
-                self.pixel(y0, x0, color)
-            else:
-                self.pixel(x0, y0, color)
             err -= dy
-            if err < 0:
-                y0 += ystep
-                err += dx
+            if err < 0 or x0 == x1:
+                run(steep, run_start, x0, y0, color)
+                run_start = x0 + 1
+                if err < 0:
+                    y0 += ystep
+                    err += dx
             x0 += 1
 
+    def _line_run(self, steep, a0, a1, b, color):
+        """Draw run a0..a1 along the major axis at minor coordinate b"""
+        if steep:
+            limit_a, limit_b = self.height, self.width
+        else:
+            limit_a, limit_b = self.width, self.height
+        if not 0 <= b < limit_b:
+            return
+        if a0 < 0:
+            a0 = 0
+        if a1 >= limit_a:
+            a1 = limit_a - 1
+        if a0 > a1:
+            return
+        self._line_span(steep, a0, a1, b, color)
+
+    def _line_span(self, steep, a0, a1, b, color):
+        """Draw an on-screen run a0..a1 without clipping"""
+        if a0 == a1:
+            if steep:
+                self._pixel_unchecked(b, a0, color)
+            else:
+                self._pixel_unchecked(a0, b, color)
+        elif steep:
+            self._fill_rect_unchecked(b, a0, 1, a1 - a0 + 1, color)
+        else:
+            self._fill_rect_unchecked(a0, b, a1 - a0 + 1, 1, color)
+
 
 def main():
     print("=== ILI9341 TPM408-2.8 Test ===")
@@ -349,10 +576,16 @@ def main():
     
     # SPI-Konfiguration
     print("Konfiguriere SPI...")
-    spi = machine.SPI(0, 
-                      baudrate=20000000,  # 20MHz für ILI9341
-                      polarity=0, 
-                      phase=0)
+    if _USE_PIO_SPI and rp2:
+        spi = PioSpiTx(0, sck=machine.Pin(18), mosi=machine.Pin(19),
+                       baudrate=20000000)  # 20MHz für ILI9341
+        spi_id = None
+    else:
+        spi = machine.SPI(0, 
+                          baudrate=20000000,  # 20MHz für ILI9341
+                          polarity=0, 
+                          phase=0)
+        spi_id = 0
     
     # Display erstellen
     print("Erstelle Display-Objekt...")
@@ -361,7 +594,8 @@ def main():
                       reset=reset_pin,
                       cs=cs_pin,
                       width=320,
-                      height=240)
+                      height=240,
+                      spi_id=spi_id)
     
     # Display initialisieren
     print("Initialisiere Display...")
@@ -411,6 +645,31 @@ def main():
         display.fill_rect(230, 100, 80, 80, MAGENTA)
         time.sleep(2)
         
+        # Test 5: Rechtecke per DMA
+        print("Test 5: Rechtecke per DMA...")
+        display.fill(BLACK)
+        display.fill_rect_async(10, 10, 300, 80, GREEN)
+        display.fill_rect_async(10, 100, 300, 80, BLUE)
+        display.wait()
+        # Komplett außerhalb (beide Maße nach dem Clipping negativ): kein DMA-Transfer
+        display.fill_rect_async(display.width + 10, display.height + 10, 10, 10, RED)
+        print("Offscreen ohne DMA:", "OK" if not display._dma_busy else "FEHLER")
+        display.wait()
+        time.sleep(2)
+
+        # Test 6: Farbverlauf aus vorberechnetem Zeilenpuffer
+        print("Test 6: Farbverlauf per blit_buffer...")
+        display.fill(BLACK)
+        line_buf = bytearray(320 * 2)
+        pack_into = struct.pack_into
+        for x in range(320):
+            red = x * 255 // 319
+            pack_into(_ENCODE_PIXEL, line_buf, x * 2, color565(red, 0, 255 - red))
+        blit = display.blit_buffer
+        for y in range(100, 140):
+            blit(line_buf, 0, y, 320, 1)
+        time.sleep(2)
+
         print("Alle Tests abgeschlossen!")
         
     except Exception as e:
@@ -2,11 +2,14 @@ import machine
 import neopixel
 import time
 
-# Zuerst testen wir mit nur 1 LED
-NUM_LEDS = 1
+# Eine NeoPixel-Instanz für alle Tests (größte getestete Länge);
+# LEDs hinter dem aktiven Bereich bleiben aus
+MAX_LEDS = 8
 pin = machine.Pin(12)
-np = neopixel.NeoPixel(pin, NUM_LEDS)
+np = neopixel.NeoPixel(pin, MAX_LEDS)
+buf = np.buf
 
+# Zuerst testen wir mit nur 1 LED
 print("Testing with 1 LED first...")
 np[0] = (255, 0, 0)  # Rot
 np.write()
@@ -20,25 +23,24 @@ time.sleep(2)
 np[0] = (0, 0, 0)    # Aus
 np.write()
 
+DIM_RED = b"\x00\x32\x00"  # Schwaches Rot (50, 0, 0) in GRB-Reihenfolge
+off = bytes(len(buf))
+
 print("Now testing with more LEDs...")
 # Jetzt schrittweise mehr LEDs testen
 for num_test in [2, 3, 4, 8]:
     print(f"Testing with {num_test} LEDs")
-    np = neopixel.NeoPixel(pin, num_test)
     
-    # Alle LEDs nacheinander rot anmachen
+    # Alle LEDs nacheinander rot anmachen (direkt im Byte-Puffer)
     for i in range(num_test):
-        # Alle aus
-        for j in range(num_test):
-            np[j] = (0, 0, 0)
-        # Eine an
-        np[i] = (50, 0, 0)  # Schwaches Rot
+        # Alle aus, eine an
+        buf[:] = off
+        buf[i * 3:i * 3 + 3] = DIM_RED
         np.write()
         print(f"  LED {i} should be on")
         time.sleep(1)
     
     # Alle aus für nächsten Test
-    for j in range(num_test):
-        np[j] = (0, 0, 0)
+    buf[:] = off
     np.write()
     time.sleep(1)
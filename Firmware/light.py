@@ -1,15 +1,21 @@
-from machine import ADC, Pin
-import time
+from machine import ADC, Pin, Timer
 
 # ADC-Pin definieren (GP28 = ADC2)
 ldr = ADC(Pin(28))
 
+# Umrechnungsfaktor ADC -> Volt nur einmal berechnen
+_ADC_TO_V = 3.3 / 65535
+
 def read_light():
     raw = ldr.read_u16()  # 0 bis 65535
-    voltage = raw * 3.3 / 65535  # optional: umrechnen in Volt
+    voltage = raw * _ADC_TO_V  # optional: umrechnen in Volt
     return raw, voltage
 
-while True:
+def print_light(timer):
     value, volt = read_light()
     print("Lichtwert:", value, "→", round(volt, 2), "V")
-    time.sleep(0.5)
+
+# Alle 0,5 s per Timer messen statt in einer blockierenden Schleife,
+# die CPU bleibt dazwischen frei
+light_timer = Timer(-1)
+light_timer.init(period=500, mode=Timer.PERIODIC, callback=print_light)
@@ -1,4 +1,6 @@
+import gc
 import machine
+import micropython
 import time
 from micropython import const
 import ustruct as struct
@@ -6,6 +8,12 @@ import math
 import dht  # DHT11/DHT22 Sensor Support
 from machine import I2S, Pin
 import array
+import framebuf
+
+try:
+    import rp2
+except ImportError:
+    rp2 = None
 
 # ILI9341 commands und Setup (vereinfacht)
 ILI9341_SWRESET = const(0x01)
@@ -26,6 +34,11 @@ ILI9341_GAMMASET = const(0x26)
 ILI9341_GMCTRP1 = const(0xE0)
 ILI9341_GMCTRN1 = const(0xE1)
 
+# Fenster-Kommandos als fertige Einzelbytes für set_window
+_CMD_CASET = bytes((ILI9341_CASET,))
+_CMD_PASET = bytes((ILI9341_PASET,))
+_CMD_RAMWR = bytes((ILI9341_RAMWR,))
+
 MADCTL_MX = const(0x40)
 MADCTL_BGR = const(0x08)
 
@@ -43,9 +56,214 @@ GRAY_LIGHT = const(0xCE79)     # Hellgrau
 GRAY_DARK = const(0x7BEF)      # Dunkelgrau
 BROWN = const(0x8200)          # Braun für Erde
 
+# Konsolen-Debugausgaben (Touch-Rohwerte, Sensorwerte, Redraws); bei 0 entfernt
+# der Compiler die `if _DEBUG:`-Zweige komplett
+_DEBUG = const(0)
+
+# Display-SPI-Takt: RP2040-Maximum (clk_peri/2 = 62,5 MHz), ILI9341 schafft das beim Schreiben
+DISPLAY_SPI_BAUDRATE = const(62500000)
+
 # Touch Controller Commands (XPT2046/ADS7843)
 TOUCH_CMD_X = const(0x90)  # X position
 TOUCH_CMD_Y = const(0xD0)  # Y position
+_TOUCH_SAMPLES = const(3)  # Messungen pro get_touch()
+_TOUCH_DEBOUNCE_MS = const(20)  # Rohzustand muss so lange stabil sein, bevor ein Touch zählt
+
+# RP2040 SPI-Register für DMA-Transfers (PL022)
+_SPI_BASE = (0x4003C000, 0x40040000)
+_DREQ_SPI_TX = (16, 18)
+_SSPDR = const(0x08)
+_SSPSR = const(0x0C)
+_SSPICR = const(0x20)
+_SSPSR_RNE = const(0x04)
+_SSPSR_BSY = const(0x10)
+_SSPICR_RORIC = const(0x01)
+# Ab dieser Pixelzahl füllt fill_rect per DMA statt über den Zeilenpuffer
+_DMA_MIN_PIXELS = const(64)
+
+# Off-Screen-Streifen: halbe Bildschirmhöhe, ein Screen = zwei Durchgänge
+_STRIP_H = const(120)
+# Pixel pro RGB565-Ausgabeblock beim Expandieren der Palettenindizes (8 Zeilen)
+_OUT_PIXELS = const(2560)
+
+# Einheitsvektoren der 8 Sonnenstrahlen (alle 45°) als Festkomma mit 16 Nachkommabits
+_SUN_RAYS = tuple(
+    (int(math.cos(angle * 3.14159 / 180) * 65536), int(math.sin(angle * 3.14159 / 180) * 65536))
+    for angle in range(0, 360, 45)
+)
+
+def _fp_ray(r3, v):
+    """Rundet r3/2 * v (v in 1/65536) wie int() Richtung Null"""
+    d = r3 * v
+    return d >> 17 if d >= 0 else -((-d) >> 17)
+
+# Änderungsschwelle pro Sensorwert, ab der ein Widget neu gezeichnet wird
+_DIRTY_TOLERANCE = {
+    'light': 5,
+    'plant_health': 1,
+}
+# Als ganze Zahl angezeigte Werte: neu zeichnen erst, wenn sich die angezeigte Zahl ändert
+_DIRTY_INT_KEYS = ('temperature', 'humidity', 'water_level')
+
+# Lichtqualität: (Untergrenze, Farbe, Beschreibung), absteigend, erster Treffer gewinnt
+_LIGHT_BANDS = (
+    (800, GREEN_LIGHT, "EXCELLENT"),
+    (600, YELLOW, "VERY GOOD"),
+    (400, ORANGE, "GOOD"),
+    (200, RED, "POOR"),
+)
+_LIGHT_BAND_LOW = (GRAY_DARK, "VERY POOR")
+
+def _light_band(light_value):
+    """(Farbe, Beschreibung) der Lichtqualität"""
+    for threshold, color, text in _LIGHT_BANDS:
+        if light_value >= threshold:
+            return color, text
+    return _LIGHT_BAND_LOW
+
+# Statusfarbe der Pflanzengesundheit: (Schwelle, Farbe) für health > Schwelle, sonst RED
+_HEALTH_BANDS = (
+    (80, GREEN_LIGHT),
+    (60, YELLOW),
+)
+
+def _health_color(health):
+    """Statusfarbe für einen Gesundheitswert"""
+    for threshold, color in _HEALTH_BANDS:
+        if health > threshold:
+            return color
+    return RED
+
+# Lichtsensor: 2^3 = 8 ADC-Wandlungen pro Messung mitteln
+_LIGHT_OVERSAMPLE_SHIFT = const(3)
+
+# Abfrageintervall pro Sensor in ms (Licht ändert sich schnell, DHT11 langsam)
+_SENSOR_POLL_MS = {
+    'light': 1000,
+    'dht': 10000,
+    'motion': 5000,
+}
+
+# Kacheln der Hauptansicht (x, y, w, h) - zugleich die Dirty-Rects der Widgets
+_MAIN_TEMPERATURE_RECT = (10, 20, 90, 80)
+_MAIN_LIGHT_RECT = (110, 20, 200, 80)
+_MAIN_HUMIDITY_RECT = (10, 110, 90, 80)
+_MAIN_HEALTH_RECT = (110, 110, 200, 80)
+
+# Unveränderlicher Teil der Einstellungen (Feinbuttons, Presets, Info-Zeile)
+_SETTINGS_STATIC_RECT = (10, 100, 310, 95)
+# Button-Zeilen der Einstellungen, Zeichnen und Touch-Bereiche nutzen dieselben Werte
+_SETTINGS_MAIN_Y = const(50)
+_SETTINGS_FINE_Y = const(100)
+_SETTINGS_PRESET_Y = const(140)
+# Preset-Buttons: (Sekunden, Farbe, Beschriftung) - 15s, 30s, 1min, 2min
+_SETTINGS_PRESETS = (
+    (15, YELLOW, "15s"),
+    (30, GREEN_LIGHT, "30s"),
+    (60, BLUE_LIGHT, "1m"),
+    (120, GRAY_LIGHT, "2m"),
+)
+
+# RGB565 big-endian der Palettenfarben für Einzelpixel, einmalig gepackt
+_COLOR_BYTES = {
+    c: struct.pack(">H", c)
+    for c in (GREEN_LIGHT, GREEN_DARK, BLUE_LIGHT, ORANGE, RED, YELLOW,
+              WHITE, BLACK, GRAY_LIGHT, GRAY_DARK, BROWN)
+}
+
+@micropython.viper
+def _fill_u16_be(buf: ptr8, count: int, hi: int, lo: int):
+    """Schreibt count big-endian 16-Bit-Pixel (hi, lo) in buf"""
+    i = 0
+    while i < count:
+        buf[2 * i] = hi
+        buf[2 * i + 1] = lo
+        i += 1
+
+# Aktive Segmente je Ziffer: oben, rechts oben, rechts unten, unten, links unten, links oben, mitte
+_DIGIT_SEGMENTS = (
+    (1,1,1,1,1,1,0), # 0
+    (0,1,1,0,0,0,0), # 1
+    (1,1,0,1,1,0,1), # 2
+    (1,1,1,1,0,0,1), # 3
+    (0,1,1,0,0,1,1), # 4
+    (1,0,1,1,0,1,1), # 5
+    (1,0,1,1,1,1,1), # 6
+    (1,1,1,0,0,0,0), # 7
+    (1,1,1,1,1,1,1), # 8
+    (1,1,1,1,0,1,1)  # 9
+)
+
+def _draw_segments(fill_rect, x, y, digit, size, color):
+    """Zeichnet die 7 Segmente einer Ziffer mit der übergebenen fill_rect-Funktion"""
+    seg = _DIGIT_SEGMENTS[digit]
+    w = size * 6
+    h = size * 10
+    
+    # Segment-Positionen (vereinfacht)
+    if seg[0]: fill_rect(x+size, y, w-2*size, size, color)           # oben
+    if seg[1]: fill_rect(x+w-size, y+size, size, h//2-size, color)  # rechts oben
+    if seg[2]: fill_rect(x+w-size, y+h//2, size, h//2-size, color)  # rechts unten
+    if seg[3]: fill_rect(x+size, y+h-size, w-2*size, size, color)   # unten
+    if seg[4]: fill_rect(x, y+h//2, size, h//2-size, color)         # links unten
+    if seg[5]: fill_rect(x, y+size, size, h//2-size, color)         # links oben
+    if seg[6]: fill_rect(x+size, y+h//2-size//2, w-2*size, size, color) # mitte
+
+# Vereinfachte 5x7 Pixel-Font für wichtige Zeichen (letzte Zeile leer),
+# jede Zeile als Bitmaske mit dem linken Pixel im höchsten der 5 Bits
+_FONT_5X7 = {
+    'A': (0b01110, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b00000),
+    'B': (0b11110, 0b10001, 0b11110, 0b10001, 0b10001, 0b11110, 0b00000),
+    'C': (0b01110, 0b10001, 0b10000, 0b10000, 0b10001, 0b01110, 0b00000),
+    'D': (0b11110, 0b10001, 0b10001, 0b10001, 0b10001, 0b11110, 0b00000),
+    'E': (0b11111, 0b10000, 0b11110, 0b10000, 0b10000, 0b11111, 0b00000),
+    'F': (0b11111, 0b10000, 0b11110, 0b10000, 0b10000, 0b10000, 0b00000),
+    'G': (0b01110, 0b10001, 0b10000, 0b10111, 0b10001, 0b01110, 0b00000),
+    'H': (0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001, 0b00000),
+    'I': (0b01110, 0b00100, 0b00100, 0b00100, 0b00100, 0b01110, 0b00000),
+    'K': (0b10001, 0b10010, 0b10100, 0b11000, 0b10100, 0b10010, 0b00000),
+    'L': (0b10000, 0b10000, 0b10000, 0b10000, 0b10000, 0b11111, 0b00000),
+    'M': (0b10001, 0b11011, 0b10101, 0b10001, 0b10001, 0b10001, 0b00000),
+    'N': (0b10001, 0b11001, 0b10101, 0b10011, 0b10001, 0b10001, 0b00000),
+    'O': (0b01110, 0b10001, 0b10001, 0b10001, 0b10001, 0b01110, 0b00000),
+    'P': (0b11110, 0b10001, 0b11110, 0b10000, 0b10000, 0b10000, 0b00000),
+    'R': (0b11110, 0b10001, 0b11110, 0b10100, 0b10010, 0b10001, 0b00000),
+    'S': (0b01111, 0b10000, 0b01110, 0b00001, 0b00001, 0b11110, 0b00000),
+    'T': (0b11111, 0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b00000),
+    'U': (0b10001, 0b10001, 0b10001, 0b10001, 0b10001, 0b01110, 0b00000),
+    'V': (0b10001, 0b10001, 0b10001, 0b10001, 0b01010, 0b00100, 0b00000),
+    'Y': (0b10001, 0b10001, 0b01010, 0b00100, 0b00100, 0b00100, 0b00000),
+    '0': (0b01110, 0b10001, 0b10001, 0b10001, 0b10001, 0b01110, 0b00000),
+    '1': (0b00100, 0b01100, 0b00100, 0b00100, 0b00100, 0b01110, 0b00000),
+    '2': (0b01110, 0b10001, 0b00010, 0b00100, 0b01000, 0b11111, 0b00000),
+    '3': (0b11110, 0b00001, 0b01110, 0b00001, 0b00001, 0b11110, 0b00000),
+    '4': (0b10010, 0b10010, 0b10010, 0b11111, 0b00010, 0b00010, 0b00000),
+    '5': (0b11111, 0b10000, 0b11110, 0b00001, 0b00001, 0b11110, 0b00000),
+    '+': (0b00000, 0b00100, 0b01110, 0b00100, 0b00000, 0b00000, 0b00000),
+    '-': (0b00000, 0b00000, 0b01110, 0b00000, 0b00000, 0b00000, 0b00000),
+    's': (0b00000, 0b01110, 0b10000, 0b01100, 0b00010, 0b11100, 0b00000),
+    'm': (0b00000, 0b11010, 0b10101, 0b10101, 0b10101, 0b10101, 0b00000),
+    'X': (0b10001, 0b01010, 0b00100, 0b00100, 0b01010, 0b10001, 0b00000),
+    ' ': (0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000, 0b00000),
+    ':': (0b00000, 0b00100, 0b00000, 0b00100, 0b00000, 0b00000, 0b00000),
+}
+
+def _row_runs(bits):
+    """Zusammenhängende Pixel einer Font-Zeile als (Spalte, Länge)-Paare"""
+    runs = []
+    col = 0
+    while col < 5:
+        if bits & (0x10 >> col):
+            start = col
+            while col < 5 and bits & (0x10 >> col):
+                col += 1
+            runs.append((start, col - start))
+        else:
+            col += 1
+    return tuple(runs)
+
+# Läufe für alle 32 möglichen Zeilenmasken, einmal beim Import berechnet
+_FONT_ROW_RUNS = tuple(_row_runs(bits) for bits in range(32))
 
 def delay_ms(ms):
     time.sleep_ms(ms)
@@ -58,6 +276,30 @@ def color565(r, g=0, b=0):
         pass
     return (r & 0xf8) << 8 | (g & 0xfc) << 3 | b >> 3
 
+@micropython.viper
+def _expand_gs8(src: ptr8, dst: ptr8, lut: ptr8, n: int):
+    """Wandelt n Palettenindizes über die Tabelle lut in big-endian RGB565 um"""
+    i = 0
+    while i < n:
+        c = src[i] << 1
+        dst[2 * i] = lut[c]
+        dst[2 * i + 1] = lut[c + 1]
+        i += 1
+
+# Zustand des Pseudozufallsgenerators für simulierte Sensorwerte
+_rng_state = array.array("I", [0x12345678])
+
+@micropython.viper
+def _lcg(state: ptr32) -> int:
+    """32-Bit-LCG (Numerical Recipes), liefert die oberen 16 Bit (0-65535)"""
+    s = state[0] * 1664525 + 1013904223
+    state[0] = s
+    return (s >> 16) & 0xFFFF
+
+def _rand_uniform(lo, hi):
+    """Gleichverteilter Wert in [lo, hi) wie random.uniform"""
+    return lo + (hi - lo) * _lcg(_rng_state) / 65536
+
 class TouchController:
     def __init__(self, spi, cs, irq):
         self.spi = spi
@@ -71,6 +313,17 @@ class TouchController:
         self.cal_y_min = 200
         self.cal_y_max = 3800
         
+        # Burst-Sequenz: alle X/Y-Messungen in einer CS-Phase (Kommando + 2 Lesebytes)
+        self._burst_tx = bytes([TOUCH_CMD_X, 0, 0, TOUCH_CMD_Y, 0, 0] * _TOUCH_SAMPLES)
+        self._burst_rx = bytearray(len(self._burst_tx))
+        # Puffer für Einzelmessungen (read_touch_raw)
+        self._tx1 = bytearray(1)
+        self._rx2 = bytearray(2)
+        
+        # Fallende Flanke an T_IRQ weckt die UI-Schleife aus wait_event()
+        self._woken = False
+        self.irq.irq(trigger=Pin.IRQ_FALLING, handler=self._on_irq)
+        
         # Touch-Controller testen
         self.test_connection()
         
@@ -98,25 +351,30 @@ class TouchController:
         
     def read_touch_raw(self, cmd):
         """Liest rohe Touch-Daten"""
+        # Ohne Wartezeiten wie im Burst von get_touch(), der XPT2046 wandelt in wenigen µs
+        tx = self._tx1
+        rx = self._rx2
+        tx[0] = cmd
         self.cs.off()
-        delay_ms(1)  # Kleine Verzögerung für stabilen CS
-        
-        # Sende Kommando
-        self.spi.write(bytes([cmd]))
-        
-        # Warte kurz und lese 2 Bytes
-        delay_ms(1)
-        result = self.spi.read(2)
-        
-        delay_ms(1)  # Kleine Verzögerung vor CS high
+        self.spi.write(tx)
+        self.spi.readinto(rx)
         self.cs.on()
         
-        if len(result) == 2:
-            # Korrekte 12-bit Auflösung (ADS7843/XPT2046)
-            value = (result[0] << 8 | result[1]) >> 3
-            return value & 0x0FFF  # 12-bit Maske
-        return 0
+        # Korrekte 12-bit Auflösung (ADS7843/XPT2046)
+        return ((rx[0] << 8 | rx[1]) >> 3) & 0x0FFF
     
+    def _on_irq(self, pin):
+        self._woken = True
+
+    def wait_event(self, timeout_ms):
+        """Schläft bis zum Touch-IRQ oder bis timeout_ms abgelaufen sind"""
+        self._woken = False
+        irq = self.irq
+        deadline = time.ticks_add(time.ticks_ms(), timeout_ms)
+        # machine.idle() hält den Kern bis zum nächsten Interrupt an (WFI)
+        while not self._woken and irq.value() and time.ticks_diff(deadline, time.ticks_ms()) > 0:
+            machine.idle()
+
     def get_touch(self):
         """Gibt Touch-Position zurück oder None falls kein Touch"""
         # Debug: IRQ Status prüfen
@@ -125,16 +383,23 @@ class TouchController:
         if irq_state == 1:  # Kein Touch (IRQ ist HIGH wenn nicht gedrückt)
             return None
             
-        # Mehrere Messungen für Stabilität
+        # Mehrere Messungen für Stabilität, alle in einer SPI-Transaktion
+        self.cs.off()
+        self.spi.write_readinto(self._burst_tx, self._burst_rx)
+        self.cs.on()
+        rx = self._burst_rx
+        
         x_sum = y_sum = 0
         valid_readings = 0
         
-        for i in range(3):  # Weniger Messungen für bessere Performance
-            x_raw = self.read_touch_raw(TOUCH_CMD_X)
-            y_raw = self.read_touch_raw(TOUCH_CMD_Y)
+        for i in range(_TOUCH_SAMPLES):
+            # 12-bit Werte (ADS7843/XPT2046) aus den zwei Bytes nach jedem Kommando
+            offset = i * 6
+            x_raw = ((rx[offset + 1] << 8 | rx[offset + 2]) >> 3) & 0x0FFF
+            y_raw = ((rx[offset + 4] << 8 | rx[offset + 5]) >> 3) & 0x0FFF
             
             # Debug-Ausgabe für erste Messung
-            if i == 0:
+            if _DEBUG and i == 0:
                 print(f"Touch raw: X={x_raw}, Y={y_raw}, IRQ={irq_state}")
             
             if x_raw > 100 and y_raw > 100 and x_raw < 4000 and y_raw < 4000:  # Gültige Werte
@@ -143,7 +408,8 @@ class TouchController:
                 valid_readings += 1
                 
         if valid_readings == 0:
-            print("Keine gültigen Touch-Messungen")
+            if _DEBUG:
+                print("Keine gültigen Touch-Messungen")
             return None
             
         # Durchschnitt berechnen
@@ -161,11 +427,12 @@ class TouchController:
         x = max(0, min(319, x))
         y = max(0, min(239, y))
         
-        print(f"Touch calculated: X={x}, Y={y} (raw avg: {x_avg}, {y_avg})")
+        if _DEBUG:
+            print(f"Touch calculated: X={x}, Y={y} (raw avg: {x_avg}, {y_avg})")
         return (x, y)
 
 class SmartPlantDisplay:
-    def __init__(self, spi, dc, reset, cs=None, touch=None):
+    def __init__(self, spi, dc, reset, cs=None, touch=None, spi_id=None):
         self.spi = spi
         self.dc = dc
         self.reset = reset
@@ -176,12 +443,74 @@ class SmartPlantDisplay:
         self.current_screen = 0
         self.last_update = 0
         self.last_touch_time = 0
+        self._last_touch_commit_ms = 0  # Zeitpunkt des letzten ausgelösten handle_touch (ticks_ms)
         self.manual_mode = False  # Touch-Steuerung aktiviert Auto-Wechsel aus
         self.last_drawn_screen = -1  # Merkt sich welcher Screen zuletzt gezeichnet wurde
         self.screen_needs_redraw = True  # Flag ob Screen neu gezeichnet werden muss
         self.last_light_value = 0  # Letzter Lichtwert für Change-Detection
         self.data_needs_update = False  # Flag nur für Daten-Updates ohne komplettes Redraw
         
+        # Pixelpuffer für fill_rect (eine Displayzeile), wird nur bei Farbwechsel neu befüllt
+        self._linebuf = bytearray(self.width * 2)
+        self._linebuf_mv = memoryview(self._linebuf)
+        self._linebuf_color = None
+        # Wiederverwendete Puffer für Kommando-/Datenbytes, Fensterkoordinaten und Einzelpixel
+        self._cmd_buf = bytearray(1)
+        self._caset_buf = bytearray(4)
+        self._paset_buf = bytearray(4)
+        self._px_buf = bytearray(2)
+        # Zuletzt gesetztes Fenster (CASET/PASET), ungültig bis zum ersten set_window
+        self._last_window = None
+        
+        # Off-Screen-Zeichenziel: ist _fb gesetzt, zeichnen die Primitive in den
+        # Framebuffer mit Ursprung (_fb_x, _fb_y) statt direkt per SPI
+        self._fb = None
+        self._fb_x = 0
+        self._fb_y = 0
+        # Off-Screen-Puffer sind GS8 mit Palettenindizes (1 Byte/Pixel), erst beim
+        # Senden wird über _lut nach RGB565 expandiert. Index 0 ist immer Schwarz.
+        self._pal = {}
+        self._lut = bytearray(512)
+        self._pal_index(BLACK)
+        try:
+            self._strip_buf = bytearray(self.width * _STRIP_H)
+            self._strip = framebuf.FrameBuffer(self._strip_buf, self.width, _STRIP_H, framebuf.GS8)
+            self._strip_mv = memoryview(self._strip_buf)
+            # Zwei Ausgabeblöcke: einer wird gesendet, während der nächste expandiert wird
+            self._out_bufs = (bytearray(_OUT_PIXELS * 2), bytearray(_OUT_PIXELS * 2))
+            self._out_mvs = tuple(memoryview(b) for b in self._out_bufs)
+        except MemoryError:
+            print("Kein RAM für Off-Screen-Puffer - zeichne direkt")
+            self._strip = None
+        
+        # Optionaler DMA-Kanal (nur Hardware-SPI auf RP2040) für die Ausgabeblöcke
+        # und für direkte fill_rect-Flächen
+        self._dma = None
+        if spi_id is not None and rp2:
+            try:
+                self._dma = rp2.DMA()
+            except (AttributeError, OSError):
+                self._dma = None
+        if self._dma:
+            self._spi_base = _SPI_BASE[spi_id]
+            self._dma_ctrl = self._dma.pack_ctrl(size=0, inc_write=False,
+                                                 treq_sel=_DREQ_SPI_TX[spi_id])
+            # Füllen: Leseadresse läuft im 2-Byte-Ring, das Pixel wiederholt sich
+            self._dma_fill_ctrl = self._dma.pack_ctrl(size=0, inc_write=False, ring_size=1,
+                                                      treq_sel=_DREQ_SPI_TX[spi_id])
+            self._dma_pix = bytearray(2)
+        
+        # Vorgerenderte Navigation-Bar (statisches Chrome), wird erst bei Bedarf
+        # angelegt und nur bei Wechsel des aktiven Buttons neu gezeichnet
+        self._nav_buf = None
+        self._nav_mv = None
+        self._nav_fb = None
+        self._nav_key = None
+        # Vorgerenderte statische Kacheln (Widget-Rahmen + Icons, Einstellungs-Buttons),
+        # immer nur die des zuletzt gezeigten Screens
+        self._tiles = {}
+        self._tiles_screen = None
+        
         # Motion-Sensor Tracking
         self.last_motion_time = 0  # Zeitpunkt der letzten Motion
         self.motion_timeout = 30000  # 30 Sekunden in Millisekunden (einstellbar)
@@ -199,17 +528,94 @@ class SmartPlantDisplay:
             'light': 0,
             'temperature': 0,
             'humidity': 0,
-            'plant_health': 0
+            'plant_health': 0,
+            'water_level': 0
+        }
+        
+        # Widget-Kacheln je Screen für Teil-Updates: Sensorwert -> (Bereich, Zeichenmethode)
+        self._widgets = {
+            0: {
+                'temperature': (_MAIN_TEMPERATURE_RECT, self._draw_main_temperature, None),
+                'light': (_MAIN_LIGHT_RECT, self._draw_main_light, None),
+                'humidity': (_MAIN_HUMIDITY_RECT, self._draw_main_humidity, None),
+                'plant_health': (_MAIN_HEALTH_RECT, self._draw_main_health, None),
+            },
+            1: {
+                'temperature': ((10, 20, 300, 40), self._draw_detail_temperature, None),
+                # Lichttext kann über die Kachel bis zum Bildschirmrand laufen
+                'light': ((10, 70, 310, 40), self._draw_detail_light, self._update_detail_light),
+                # Dreistelliger Füllstand reicht ebenfalls bis an den Rand
+                'water_level': ((10, 120, 310, 40), self._draw_detail_water, None),
+            },
+            2: {
+                'motion_timeout': ((10, 10, 300, 80), self._draw_settings_timeout, None),
+            },
+        }
+        self.dirty_widgets = set()
+        
+        # Touch-Bereiche pro Screen: (x0, x1, y0, y1, Aktion, Argument), erster Treffer gewinnt.
+        # Die Navigation-Bar (unterste 40px) gilt auf allen Screens.
+        nav_y = self.height - 40
+        nav = (
+            (0, self.width // 2 - 1, nav_y, self.height - 1, self._go_to_screen, 0),       # Dashboard
+            (self.width // 2, self.width - 1, nav_y, self.height - 1, self._go_to_screen, 2),  # Settings
+        )
+        # Settings: Hauptbuttons (y 50-90), Feineinstellung (y 100-130), Presets (y 140-165)
+        settings = (
+            (20, 80, _SETTINGS_MAIN_Y, _SETTINGS_MAIN_Y + 40, self._change_motion_timeout, -10),
+            (240, 300, _SETTINGS_MAIN_Y, _SETTINGS_MAIN_Y + 40, self._change_motion_timeout, 10),
+            (50, 100, _SETTINGS_FINE_Y, _SETTINGS_FINE_Y + 30, self._change_motion_timeout, -5),
+            (220, 270, _SETTINGS_FINE_Y, _SETTINGS_FINE_Y + 30, self._change_motion_timeout, 5),
+        ) + tuple(
+            (20 + i * 70, 80 + i * 70, _SETTINGS_PRESET_Y, _SETTINGS_PRESET_Y + 25,
+             self._set_motion_timeout_preset, preset[0])
+            for i, preset in enumerate(_SETTINGS_PRESETS)
+        )
+        self._hit_regions = {
+            # Main: jedes Widget führt zur Detailansicht
+            0: nav + (
+                (10, 100, 20, 100, self._go_to_screen, 1),
+                (110, 200, 20, 100, self._go_to_screen, 1),
+                (210, 300, 20, 100, self._go_to_screen, 1),
+                (10, 100, 110, 190, self._go_to_screen, 1),
+                (110, 300, 110, 190, self._go_to_screen, 1),
+            ),
+            # Detail: Tippen irgendwo (außer Navigation-Bar) geht zurück zum Dashboard
+            1: nav + ((0, self.width - 1, 0, nav_y - 1, self._go_to_screen, 0),),
+            2: nav + settings,
         }
+        # Zuletzt gezeichnete Fortschrittsbalken: (x, y, w, h) -> (Breite, bg, fg)
+        self._pb_state = {}
+        # Ziffern- und Textmasken (1 Bit) und 2-Farben-Palette zum Einfärben
+        self._digit_cache = {}
+        self._text_cache = {}
+        self._mask_palette = framebuf.FrameBuffer(bytearray(2), 2, 1, framebuf.GS8)
+        # Spannbreiten der Rundungen pro Eckenradius
+        self._corner_spans = {}
+        # Halbe Spannbreiten der Kreiszeilen pro Radius
+        self._circle_spans = {}
         
         # Sensoren initialisieren
         self.light_sensor = machine.ADC(machine.Pin(28))  # GP28 = ADC2 (Lichtsensor)
         self.dht_sensor = dht.DHT11(machine.Pin(27))  # GP26 = DHT11 Temp/Feuchtigkeit Sensor
         self.motion_pin = machine.Pin(26, machine.Pin.IN)  # GP27 = Motion Sensor
         
+        # Letzte Messungen zwischenspeichern (DHT11 höchstens alle 2s, ADC alle 50ms)
+        self._last_dht_ms = None
+        self._last_dht = (None, None)
+        self._last_light_ms = None
+        self._last_light = None
+        
         # Motion-Sensor beim Start initialisieren
         current_time = time.ticks_ms()
         self.last_motion_time = current_time  # Starte mit "gerade Motion erkannt"
+        
+        # Alle Zeitstempel relativ zu ticks_ms() starten: ein fester Wert wie 0 liegt nach
+        # rund 6 Tagen Laufzeit für ticks_diff() in der "Zukunft" und blockiert die Timer
+        self.last_motion_check = current_time
+        self._last_touch_commit_ms = time.ticks_add(current_time, -_TOUCH_DEBOUNCE_MS)
+        # Nächster Abfragezeitpunkt pro Sensor (ticks_ms), alle sofort fällig
+        self._next_poll = {'light': current_time, 'dht': current_time, 'motion': current_time}
         print(f"Motion-Sensor initialisiert - {self.motion_timeout_seconds}s Timer gestartet")
         
         # Simulierte Sensordaten
@@ -241,34 +647,62 @@ class SmartPlantDisplay:
     def write_cmd(self, cmd):
         self.cs_low()
         self.dc_low()
-        self.spi.write(bytes([cmd]))
+        buf = self._cmd_buf
+        buf[0] = cmd
+        self.spi.write(buf)
         self.cs_high()
 
     def write_data(self, data):
-        self.cs_low()
-        self.dc_high()
         if isinstance(data, int):
-            self.spi.write(bytes([data]))
+            self._write_data_byte(data)
         else:
-            self.spi.write(data)
+            self._write_data_bytes(data)
+
+    def _write_data_byte(self, value):
+        buf = self._cmd_buf
+        buf[0] = value
+        self._write_data_bytes(buf)
+
+    def _write_data_bytes(self, buf):
+        """Fertigen Puffer als Daten senden, ohne Typprüfung (für Hotpaths)"""
+        self.cs_low()
+        self.dc_high()
+        self.spi.write(buf)
         self.cs_high()
 
     def write_cmd_data(self, cmd, data=None):
+        if data is None:
+            self.write_cmd(cmd)
+        elif isinstance(data, int):
+            # Nur bei der Initialisierung, _cmd_buf ist hier schon mit dem Kommando belegt
+            self._write_cmd_bytes(cmd, bytes((data,)))
+        else:
+            self._write_cmd_bytes(cmd, data)
+
+    def _write_cmd_bytes(self, cmd, buf):
+        """Kommando plus fertigen Datenpuffer in einer CS-Phase senden, ohne Typprüfung"""
         self.cs_low()
         self.dc_low()
-        self.spi.write(bytes([cmd]))
-        if data is not None:
-            self.dc_high()
-            if isinstance(data, int):
-                self.spi.write(bytes([data]))
-            else:
-                self.spi.write(data)
+        cmd_buf = self._cmd_buf
+        cmd_buf[0] = cmd
+        self.spi.write(cmd_buf)
+        self.dc_high()
+        self.spi.write(buf)
         self.cs_high()
 
     def init(self):
         """Schnelle Initialisierung"""
         print("Initialisiere Display...")
         
+        # Bus auf vollen Takt bringen und prüfen, dass Hardware-SPI benutzt wird
+        if isinstance(self.spi, machine.SoftSPI):
+            print("⚠️  Display hängt an SoftSPI - Hardware-SPI ist um ein Vielfaches schneller")
+        try:
+            self.spi.init(baudrate=DISPLAY_SPI_BAUDRATE, polarity=0, phase=0)
+        except Exception as e:
+            print(f"SPI-Takt konnte nicht gesetzt werden: {e}")
+        print(f"Display SPI: {self.spi}")
+        
         if self.reset:
             self.reset.off()
             delay_ms(100)
@@ -277,6 +711,8 @@ class SmartPlantDisplay:
         
         self.write_cmd(ILI9341_SWRESET)
         delay_ms(150)
+        # Reset setzt auch das Adressfenster zurück
+        self._last_window = None
         
         self.write_cmd(ILI9341_SLPOUT)
         delay_ms(120)
@@ -299,111 +735,326 @@ class SmartPlantDisplay:
         print("Display bereit!")
 
     def set_window(self, x0, y0, x1, y1):
-        self.write_cmd_data(ILI9341_CASET, struct.pack(">HH", x0, x1))
-        self.write_cmd_data(ILI9341_PASET, struct.pack(">HH", y0, y1))
-        self.write_cmd(ILI9341_RAMWR)
+        # Gleiches Fenster wie zuletzt: RAMWR allein setzt den Schreibzeiger zurück
+        if self._last_window == (x0, y0, x1, y1):
+            self.write_cmd(ILI9341_RAMWR)
+            return
+        self._last_window = (x0, y0, x1, y1)
+        struct.pack_into(">HH", self._caset_buf, 0, x0, x1)
+        struct.pack_into(">HH", self._paset_buf, 0, y0, y1)
+        # CASET, PASET und RAMWR in einer CS-Phase, DC trennt Kommando und Daten
+        write = self.spi.write
+        self.cs_low()
+        self.dc_low()
+        write(_CMD_CASET)
+        self.dc_high()
+        write(self._caset_buf)
+        self.dc_low()
+        write(_CMD_PASET)
+        self.dc_high()
+        write(self._paset_buf)
+        self.dc_low()
+        write(_CMD_RAMWR)
+        self.cs_high()
 
     def fill_rect(self, x, y, w, h, color):
+        if self._fb:
+            self._fb.fill_rect(x - self._fb_x, y - self._fb_y, w, h, self._pal_index(color))
+            return
         if x + w > self.width:
             w = self.width - x
         if y + h > self.height:
             h = self.height - y
+        if w <= 0 or h <= 0:
+            return
         
         self.set_window(x, y, x + w - 1, y + h - 1)
-        pixel_data = struct.pack(">H", color)
         
         self.cs_low()
         self.dc_high()
-        for _ in range(w * h):
-            self.spi.write(pixel_data)
+        n = w * h
+        if self._dma and n >= _DMA_MIN_PIXELS:
+            # Große Flächen ohne Python-Schleife: DMA wiederholt das Pixel n-mal
+            struct.pack_into(">H", self._dma_pix, 0, color)
+            self._dma.config(read=self._dma_pix, write=self._spi_base + _SSPDR,
+                             count=n * 2, ctrl=self._dma_fill_ctrl, trigger=True)
+            self._dma_wait()
+        else:
+            self._fill_pixels(n, color)
         self.cs_high()
 
+    def _fill_pixels(self, n, color):
+        """Sendet n Pixel einer Farbe blockweise (eine Displayzeile pro spi.write)"""
+        if n <= 0:
+            return
+        buf = self._linebuf
+        if color != self._linebuf_color:
+            _fill_u16_be(buf, len(buf) // 2, (color >> 8) & 0xFF, color & 0xFF)
+            self._linebuf_color = color
+        
+        full, rem = divmod(n, len(buf) // 2)
+        write = self.spi.write
+        for _ in range(full):
+            write(buf)
+        if rem:
+            write(self._linebuf_mv[:rem * 2])
+
     def fill(self, color):
         self.fill_rect(0, 0, self.width, self.height, color)
 
     def pixel(self, x, y, color):
-        if 0 <= x < self.width and 0 <= y < self.height:
+        if self._fb:
+            self._fb.pixel(x - self._fb_x, y - self._fb_y, self._pal_index(color))
+        elif 0 <= x < self.width and 0 <= y < self.height:
             self.set_window(x, y, x, y)
-            self.write_data(struct.pack(">H", color))
+            data = _COLOR_BYTES.get(color)
+            if data is None:
+                struct.pack_into(">H", self._px_buf, 0, color)
+                data = self._px_buf
+            self._write_data_bytes(data)
+
+    def blit_buffer(self, buf, x, y, w, h):
+        """Überträgt fertige RGB565-Pixeldaten (big-endian) in ein Fenster"""
+        self.set_window(x, y, x + w - 1, y + h - 1)
+        self.cs_low()
+        self.dc_high()
+        self.spi.write(buf)
+        self.cs_high()
+
+    def _pal_index(self, color):
+        """Palettenindex einer RGB565-Farbe, neue Farben bekommen den nächsten freien Eintrag"""
+        index = self._pal.get(color)
+        if index is None:
+            index = len(self._pal)
+            if index > 255:
+                raise ValueError("Palette voll (max. 256 Farben)")
+            self._pal[color] = index
+            self._lut[2 * index] = color >> 8
+            self._lut[2 * index + 1] = color & 0xFF
+        return index
+
+    def _flush_indexed(self, buf, x, y, w, h):
+        """Sendet GS8-Palettenpixel als RGB565 in ein Fenster, blockweise expandiert"""
+        self.set_window(x, y, x + w - 1, y + h - 1)
+        self.cs_low()
+        self.dc_high()
+        dma = self._dma
+        n = w * h
+        i = 0
+        for start in range(0, n, _OUT_PIXELS):
+            count = min(_OUT_PIXELS, n - start)
+            _expand_gs8(buf[start:start + count], self._out_bufs[i], self._lut, count)
+            if dma:
+                # Vorherigen Block abwarten, dieser wurde parallel dazu expandiert
+                if start:
+                    self._dma_wait()
+                dma.config(read=self._out_bufs[i], write=self._spi_base + _SSPDR,
+                           count=count * 2, ctrl=self._dma_ctrl, trigger=True)
+                i ^= 1
+            else:
+                self.spi.write(self._out_mvs[0][:count * 2])
+        if dma:
+            self._dma_wait()
+        self.cs_high()
+
+    def _dma_wait(self):
+        """Wartet bis der laufende DMA-Block vollständig aus der SPI ist"""
+        while self._dma.active():
+            pass
+        sr = self._spi_base + _SSPSR
+        while machine.mem32[sr] & _SSPSR_BSY:
+            pass
+        # Vom DMA nicht gelesene RX-Bytes verwerfen und Overrun-Flag löschen
+        dr = self._spi_base + _SSPDR
+        while machine.mem32[sr] & _SSPSR_RNE:
+            machine.mem32[dr]
+        machine.mem32[self._spi_base + _SSPICR] = _SSPICR_RORIC
+
+    def render(self, draw, x=0, y=0, w=None, h=None):
+        """Zeichnet einen Bereich (Standard: ganzer Screen) off-screen und blittet ihn streifenweise"""
+        if w is None:
+            w = self.width
+        if h is None:
+            h = self.height
+        if w == self.width and h == self.height:
+            # Ganzer Screen wird neu gezeichnet, gemerkte Balken sind ungültig
+            self._pb_state.clear()
+        if self._strip is None:
+            # Ohne Off-Screen-Puffer direkt zeichnen, Bereich vorher löschen
+            self.fill_rect(x, y, w, h, BLACK)
+            draw()
+            return
+        
+        # Streifenhöhe ergibt sich aus der Bereichsbreite
+        rows = min(len(self._strip_buf) // w, h)
+        if w == self.width and rows == _STRIP_H:
+            fb = self._strip
+        else:
+            fb = framebuf.FrameBuffer(self._strip_buf, w, rows, framebuf.GS8)
+        strip_mv = self._strip_mv
+        self._fb = fb
+        self._fb_x = x
+        try:
+            for y0 in range(y, y + h, rows):
+                sh = min(rows, y + h - y0)
+                self._fb_y = y0
+                fb.fill(0)
+                draw()
+                self._flush_indexed(strip_mv[:w * sh], x, y0, w, sh)
+        finally:
+            self._fb = None
+            self._fb_x = 0
+            self._fb_y = 0
 
     def hline(self, x, y, w, color):
-        self.fill_rect(x, y, w, 1, color)
+        fb = self._fb
+        if fb:
+            # Im Streifen direkt die native framebuf-Linie, ohne Umweg über fill_rect
+            fb.hline(x - self._fb_x, y - self._fb_y, w, self._pal_index(color))
+        else:
+            self.fill_rect(x, y, w, 1, color)
 
     def vline(self, x, y, h, color):
-        self.fill_rect(x, y, 1, h, color)
+        fb = self._fb
+        if fb:
+            fb.vline(x - self._fb_x, y - self._fb_y, h, self._pal_index(color))
+        else:
+            self.fill_rect(x, y, 1, h, color)
 
     # UI-spezifische Funktionen
     def draw_rounded_rect(self, x, y, w, h, radius, color):
         """Zeichnet ein abgerundetes Rechteck"""
-        # Hauptrechteck
+        if radius == 0:
+            self.fill_rect(x, y, w, h, color)
+            return
+        spans = self._corner_span(radius)
+        
+        if w >= 2*radius and h >= 2*radius:
+            # Mittelteil in voller Breite, darüber und darunter je Zeile eine Linie
+            # aus Hauptrechteck und beiden Ecken
+            self.fill_rect(x, y + radius, w, h - 2*radius, color)
+            self.hline(x + radius, y, w - 2*radius, color)
+            for j in range(1, radius):
+                n = spans[j]
+                self.hline(x + radius - n + 1, y + radius - j, w - 2*radius + 2*n - 1, color)
+            for j, n in enumerate(spans):
+                self.hline(x + radius - n + 1, y + h - radius + j, w - 2*radius + 2*n - 1, color)
+            return
+        
+        # Sehr schmale Rechtecke (z.B. kurze Fortschrittsbalken): Kreuz plus Ecken
         self.fill_rect(x + radius, y, w - 2*radius, h, color)
         self.fill_rect(x, y + radius, radius, h - 2*radius, color)
         self.fill_rect(x + w - radius, y + radius, radius, h - 2*radius, color)
         
-        # Ecken (vereinfacht)
-        for i in range(radius):
-            for j in range(radius):
-                if i*i + j*j <= radius*radius:
-                    self.pixel(x + radius - i, y + radius - j, color)
-                    self.pixel(x + w - radius + i, y + radius - j, color)
-                    self.pixel(x + radius - i, y + h - radius + j, color)
-                    self.pixel(x + w - radius + i, y + h - radius + j, color)
+        # Ecken (vereinfacht): eine horizontale Linie pro Eckzeile
+        for j, n in enumerate(spans):
+            self.hline(x + radius - n + 1, y + radius - j, n, color)
+            self.hline(x + w - radius, y + radius - j, n, color)
+            self.hline(x + radius - n + 1, y + h - radius + j, n, color)
+            self.hline(x + w - radius, y + h - radius + j, n, color)
+
+    def _corner_span(self, radius):
+        """Pixel pro Eckzeile j (alle i < radius mit i*i + j*j <= radius*radius), pro Radius gecacht"""
+        spans = self._corner_spans.get(radius)
+        if spans is None:
+            r2 = radius * radius
+            spans = tuple(min(radius - 1, int(math.sqrt(r2 - j * j))) + 1 for j in range(radius))
+            self._corner_spans[radius] = spans
+        return spans
+
+    def _circle_span(self, radius):
+        """Halbe Spannbreite je Zeilenabstand dy: größtes dx mit dx*dx + dy*dy <= r*r, pro Radius gecacht"""
+        spans = self._circle_spans.get(radius)
+        if spans is None:
+            r2 = radius * radius
+            spans = tuple(int(math.sqrt(r2 - dy * dy)) for dy in range(radius + 1))
+            self._circle_spans[radius] = spans
+        return spans
 
     def draw_circle(self, cx, cy, radius, color):
-        """Zeichnet einen Kreis"""
-        for x in range(-radius, radius + 1):
-            for y in range(-radius, radius + 1):
-                if x*x + y*y <= radius*radius:
-                    self.pixel(cx + x, cy + y, color)
+        """Zeichnet einen gefüllten Kreis als eine horizontale Linie pro Zeile"""
+        spans = self._circle_span(radius)
+        height = self.height
+        for dy in range(-radius, radius + 1):
+            y = cy + dy
+            if 0 <= y < height:
+                dx = spans[dy if dy >= 0 else -dy]
+                x0 = max(cx - dx, 0)
+                self.hline(x0, y, cx + dx + 1 - x0, color)
 
     def draw_progress_bar(self, x, y, w, h, value, max_value, bg_color, fg_color):
-        """Zeichnet einen Fortschrittsbalken"""
+        """Zeichnet einen Fortschrittsbalken (direkt aufs Display nur die Änderung)"""
+        progress_w = int((value / max_value) * (w - 4))
+        key = (x, y, w, h)
+        last = self._pb_state.get(key)
+        self._pb_state[key] = (progress_w, bg_color, fg_color)
+        
+        if (self._fb is None and last is not None and last[1] == bg_color and last[2] == fg_color
+                and 0 <= progress_w <= w - 4 and 0 <= last[0] <= w - 4):
+            # Unveränderter Anfang bleibt stehen: nur die Spalten zwischen altem
+            # und neuem Balkenende (inkl. 2px Eckenradius) neu rendern
+            old_w = last[0]
+            x0 = x + 2 + max(min(old_w, progress_w) - 2, 0)
+            x1 = x + 2 + max(old_w, progress_w)
+            if old_w != progress_w and x1 > x0:
+                self.render(lambda: self._draw_progress_bar(x, y, w, h, progress_w, bg_color, fg_color),
+                            x0, y + 2, x1 - x0, h - 4)
+            return
+        
+        self._draw_progress_bar(x, y, w, h, progress_w, bg_color, fg_color)
+
+    def _draw_progress_bar(self, x, y, w, h, progress_w, bg_color, fg_color):
         # Hintergrund
         self.draw_rounded_rect(x, y, w, h, 3, bg_color)
         
         # Fortschritt
-        progress_w = int((value / max_value) * (w - 4))
         if progress_w > 0:
             self.draw_rounded_rect(x + 2, y + 2, progress_w, h - 4, 2, fg_color)
 
     def draw_digit(self, x, y, digit, size, color):
         """Einfache 7-Segment-Anzeige für Zahlen"""
-        segments = [
-            [1,1,1,1,1,1,0], # 0
-            [0,1,1,0,0,0,0], # 1
-            [1,1,0,1,1,0,1], # 2
-            [1,1,1,1,0,0,1], # 3
-            [0,1,1,0,0,1,1], # 4
-            [1,0,1,1,0,1,1], # 5
-            [1,0,1,1,1,1,1], # 6
-            [1,1,1,0,0,0,0], # 7
-            [1,1,1,1,1,1,1], # 8
-            [1,1,1,1,0,1,1]  # 9
-        ]
-        
         if 0 <= digit <= 9:
-            seg = segments[digit]
+            if self._fb:
+                # Vorgerenderte Ziffernmaske mit einem blit einfärben
+                self._blit_mask(self._digit_sprite(size, digit), x, y, color)
+            else:
+                _draw_segments(self.fill_rect, x, y, digit, size, color)
+
+    def _blit_mask(self, mask, x, y, color):
+        """Färbt eine 1-Bit-Maske über die Palette ein, Hintergrund (Palette 0 = key) bleibt transparent"""
+        index = self._pal_index(color)
+        key = index ^ 1
+        self._mask_palette.pixel(0, 0, key)
+        self._mask_palette.pixel(1, 0, index)
+        self._fb.blit(mask, x - self._fb_x, y - self._fb_y, key, self._mask_palette)
+
+    def _digit_sprite(self, size, digit):
+        """1-Bit-Maske einer Ziffer, pro Größe einmalig erzeugt"""
+        sprites = self._digit_cache.get(size)
+        if sprites is None:
             w = size * 6
             h = size * 10
-            
-            # Segment-Positionen (vereinfacht)
-            if seg[0]: self.fill_rect(x+size, y, w-2*size, size, color)           # oben
-            if seg[1]: self.fill_rect(x+w-size, y+size, size, h//2-size, color)  # rechts oben
-            if seg[2]: self.fill_rect(x+w-size, y+h//2, size, h//2-size, color)  # rechts unten
-            if seg[3]: self.fill_rect(x+size, y+h-size, w-2*size, size, color)   # unten
-            if seg[4]: self.fill_rect(x, y+h//2, size, h//2-size, color)         # links unten
-            if seg[5]: self.fill_rect(x, y+size, size, h//2-size, color)         # links oben
-            if seg[6]: self.fill_rect(x+size, y+h//2-size//2, w-2*size, size, color) # mitte
+            sprites = []
+            for d in range(10):
+                fb = framebuf.FrameBuffer(bytearray(((w + 7) // 8) * h), w, h, framebuf.MONO_HLSB)
+                _draw_segments(fb.fill_rect, 0, 0, d, size, 1)
+                sprites.append(fb)
+            self._digit_cache[size] = sprites
+        return sprites[digit]
 
     def draw_number(self, x, y, number, size, color):
         """Zeichnet eine mehrstellige Zahl"""
-        num_str = str(int(number))
+        n = max(0, int(number))  # Die 7-Segment-Anzeige kennt kein Minuszeichen
         digit_width = size * 8  # Etwas mehr Abstand zwischen Ziffern
         
-        for i, digit_char in enumerate(num_str):
-            digit = int(digit_char)
-            digit_x = x + i * digit_width
-            self.draw_digit(digit_x, y, digit, size, color)
+        # Höchste Stelle bestimmen, dann Ziffern ohne Umweg über str() abziehen
+        div = 1
+        while n >= div * 10:
+            div *= 10
+        while div:
+            self.draw_digit(x, y, n // div % 10, size, color)
+            x += digit_width
+            div //= 10
 
     def draw_icon_plant(self, x, y, size, color):
         """Zeichnet ein Pflanzen-Icon"""
@@ -433,54 +1084,72 @@ class SmartPlantDisplay:
         center_x, center_y = x + size//2, y + size//2
         radius = size//4
         
-        # Sonnenstrahlen
-        for angle in range(0, 360, 45):
-            angle_rad = angle * 3.14159 / 180
-            x1 = center_x + int(radius * 1.5 * math.cos(angle_rad))
-            y1 = center_y + int(radius * 1.5 * math.sin(angle_rad))
-            x2 = center_x + int(radius * 2 * math.cos(angle_rad))
-            y2 = center_y + int(radius * 2 * math.sin(angle_rad))
+        # Sonnenstrahlen bei 1,5 * radius (Richtungen aus _SUN_RAYS, nur Integer)
+        r3 = radius * 3
+        width = self.width
+        for cos_a, sin_a in _SUN_RAYS:
+            x1 = center_x + _fp_ray(r3, cos_a)
+            y1 = center_y + _fp_ray(r3, sin_a)
             
-            # Einfache Linie (nur ein paar Pixel)
-            for i in range(3):
-                if 0 <= x1+i < self.width and 0 <= y1 < self.height:
-                    self.pixel(x1+i, y1, color)
+            # Einfache Linie (3 Pixel), am Bildschirmrand abgeschnitten
+            if 0 <= y1 < self.height:
+                x0 = max(x1, 0)
+                x_end = min(x1 + 3, width)
+                if x_end > x0:
+                    self.hline(x0, y1, x_end - x0, color)
         
         # Sonne selbst
         self.draw_circle(center_x, center_y, radius, color)
 
     def read_light_sensor(self):
         """Liest den realen Lichtsensor (ADC)"""
+        now = time.ticks_ms()
+        if self._last_light_ms is not None and time.ticks_diff(now, self._last_light_ms) < 50:
+            return self._last_light
+        self._last_light_ms = now
         try:
-            raw = self.light_sensor.read_u16()  # 0 bis 65535
+            # Mehrere Wandlungen mitteln, damit ADC-Rauschen keine Redraws auslöst
+            read_u16 = self.light_sensor.read_u16
+            raw = 0
+            for _ in range(1 << _LIGHT_OVERSAMPLE_SHIFT):
+                raw += read_u16()
+            raw >>= _LIGHT_OVERSAMPLE_SHIFT  # 0 bis 65535
             voltage = raw * 3.3 / 65535  # Umrechnen in Volt
             
             # Umrechnung in Lux-ähnliche Werte (0-1000)
             # Diese Kalibrierung muss eventuell angepasst werden
             light_value = int((raw / 65535) * 1000)
             
-            return light_value, voltage, raw
+            self._last_light = (light_value, voltage, raw)
         except Exception as e:
             print(f"Lichtsensor Fehler: {e}")
-            return 500, 1.65, 32767  # Fallback-Werte
+            self._last_light = (500, 1.65, 32767)  # Fallback-Werte
+        return self._last_light
 
     def read_temp_humidity_sensor(self):
         """Liest den echten DHT11 Temperatur/Feuchtigkeitssensor (GP26)"""
+        # measure() blockiert ~20ms, der DHT11 liefert ohnehin nur alle 2s neue Werte
+        now = time.ticks_ms()
+        if self._last_dht_ms is not None and time.ticks_diff(now, self._last_dht_ms) < 2000:
+            return self._last_dht
+        self._last_dht_ms = now
         try:
             # DHT11 Sensor auslesen
             self.dht_sensor.measure()
             temperature = self.dht_sensor.temperature()  # Celsius
             humidity = self.dht_sensor.humidity()        # Prozent
             
-            print(f"DHT11 - Temp: {temperature}°C, Humidity: {humidity}%")
-            return temperature, humidity
+            if _DEBUG:
+                print(f"DHT11 - Temp: {temperature}°C, Humidity: {humidity}%")
+            self._last_dht = (temperature, humidity)
             
         except OSError as e:
             print(f"DHT11 Sensor Fehler: {e} (Sensor nicht angeschlossen oder defekt?)")
-            return None, None
+            self._last_dht = (None, None)
         except Exception as e:
             print(f"DHT11 unbekannter Fehler: {e}")
-            return None, None
+            self._last_dht = (None, None)
+        return self._last_dht
 
     def read_motion_sensor(self):
         """Liest den Motion-Sensor (GP27) mit 30s Timeout und Audio-Bestrafung/Belohnung"""
@@ -510,10 +1179,9 @@ class SmartPlantDisplay:
                 
                 # Wenn länger als eingestellte Zeit keine Motion
                 if time.ticks_diff(current_time, self.last_motion_time) > self.motion_timeout:
-                    print(f"⚠️  Keine Motion seit {self.motion_timeout_seconds}+ Sekunden - BESTRAFUNG!")
-                    
-                    # Audio-Bestrafung nur einmal pro Timeout-Periode abspielen
+                    # Audio-Bestrafung (und Meldung) nur einmal pro Timeout-Periode
                     if not self.audio_played:
+                        print(f"⚠️  Keine Motion seit {self.motion_timeout_seconds}+ Sekunden - BESTRAFUNG!")
                         self.play_punishment_sound()
                         self.audio_played = True
                         
@@ -538,10 +1206,46 @@ class SmartPlantDisplay:
                 ibuf=20000,
             )
             print("I2S Audio-System initialisiert (GP10=BCLK, GP11=WS, GP12=DIN)")
+            
+            # Sinusperioden einmalig vorberechnen statt bei jedem Abspielen
+            self._punishment_wave = self._build_sine_wave(3000, 32767)  # 3000 Hz, max Amplitude
+            self._reward_waves = [
+                self._build_sine_wave(freq, 16383)  # 50% Amplitude
+                for freq in (261.63, 329.63, 392.00, 523.25)  # C4, E4, G4, C5
+            ]
+            # Gemeinsamer 8KB-Block, in den die Perioden eines Tons gekachelt werden
+            self._audio_chunk = array.array("h", bytes(8192))
         except Exception as e:
             print(f"I2S Audio-System Fehler: {e}")
             self.i2s = None
 
+    def _build_sine_wave(self, frequency, amplitude, sample_rate=22050):
+        """Erzeugt eine Periode einer Sinuswelle als 16-bit Sample-Array"""
+        samples_per_cycle = sample_rate // int(frequency)
+        # Direkt ins Array schreiben, ohne temporäre Liste auf dem Heap
+        wave = array.array("h", bytes(2 * samples_per_cycle))
+        step = 2 * math.pi / samples_per_cycle
+        for i in range(samples_per_cycle):
+            wave[i] = int(amplitude * math.sin(step * i))
+        return wave
+
+    def _play_wave(self, wave, num_cycles):
+        """Spielt num_cycles Perioden einer Welle in großen Blöcken statt periodenweise ab"""
+        samples_per_cycle = len(wave)
+        cycles_per_chunk = len(self._audio_chunk) // samples_per_cycle
+        mv = memoryview(self._audio_chunk)
+        for i in range(cycles_per_chunk):
+            mv[i * samples_per_cycle:(i + 1) * samples_per_cycle] = wave
+        
+        chunk = mv[:cycles_per_chunk * samples_per_cycle]
+        full, rest = divmod(num_cycles, cycles_per_chunk)
+        for _ in range(full):
+            self.i2s.write(chunk)
+            # Kurze Pause zwischen den Blöcken um responsive zu bleiben
+            time.sleep_ms(1)
+        if rest:
+            self.i2s.write(mv[:rest * samples_per_cycle])
+
     def play_punishment_sound(self):
         """Spielt Bestrafungs-Sound ab (5s Sinuswelle bei 3000 Hz)"""
         if not self.i2s:
@@ -553,24 +1257,15 @@ class SmartPlantDisplay:
             
             # Sinuswellen-Parameter
             sample_rate = 22050
-            frequency = 3000  # Kammerton A
-            amplitude = 32767  # max für 16-bit Audio
             duration = 5  # Sekunden
-            samples_per_cycle = sample_rate // frequency
-
-            # Erzeuge eine Sinuswelle
-            sine_wave = array.array("h", [
-                int(amplitude * math.sin(2 * math.pi * i / samples_per_cycle))
-                for i in range(samples_per_cycle)
-            ])
+            
+            # Vorberechnete Sinuswelle (3000 Hz, siehe setup_audio_system)
+            sine_wave = self._punishment_wave
+            samples_per_cycle = len(sine_wave)
 
             # Wiederhole die Welle für die gewünschte Dauer
             num_cycles = int(sample_rate * duration // samples_per_cycle)
-            for cycle in range(num_cycles):
-                self.i2s.write(sine_wave)
-                # Kurze Pause alle 50 Zyklen um responsive zu bleiben
-                if cycle % 50 == 0:
-                    time.sleep_ms(1)
+            self._play_wave(sine_wave, num_cycles)
             
             print("🎵 Bestrafungs-Sound beendet")
             
@@ -588,36 +1283,17 @@ class SmartPlantDisplay:
             
             # Belohnungs-Melodie Parameter
             sample_rate = 22050
-            amplitude = 16383  # Etwas leiser als Bestrafung (50% Amplitude)
-            duration = 2  # Kürzere, angenehme Belohnung
-            
-            # Angenehme Akkord-Progression: C-E-G (C-Dur Dreiklang)
-            frequencies = [
-                261.63,  # C4
-                329.63,  # E4
-                392.00,  # G4
-                523.25   # C5 (Oktave höher)
-            ]
             
             # Jede Note für 0.5 Sekunden spielen
             note_duration = 0.5
             
-            for freq in frequencies:
-                samples_per_cycle = sample_rate // int(freq)
-                
-                # Erzeuge Sinuswelle für diese Note
-                sine_wave = array.array("h", [
-                    int(amplitude * math.sin(2 * math.pi * i / samples_per_cycle))
-                    for i in range(samples_per_cycle)
-                ])
+            # Angenehme Akkord-Progression: C-E-G-C (vorberechnet in setup_audio_system)
+            for sine_wave in self._reward_waves:
+                samples_per_cycle = len(sine_wave)
                 
                 # Spiele Note für die gewünschte Dauer
                 num_cycles = int(sample_rate * note_duration // samples_per_cycle)
-                for cycle in range(num_cycles):
-                    self.i2s.write(sine_wave)
-                    # Kurze Pause für Responsivität
-                    if cycle % 20 == 0:
-                        time.sleep_ms(1)
+                self._play_wave(sine_wave, num_cycles)
             
             print("🎵 Belohnungs-Melodie beendet - Gut gemacht!")
             
@@ -638,26 +1314,43 @@ class SmartPlantDisplay:
 
     def show_main_screen(self):
         """Hauptbildschirm mit Übersicht"""
+        self._use_tiles(0)
+        self.render(self._draw_main_screen)
+
+    def _draw_main_screen(self):
         self.fill(BLACK)
         
-        # Touch-Bereiche für Widgets (ohne Header, mehr Platz)
-        y_start = 20
-        
         # Erste Reihe: Temperature (1 Box) + Light (2 Boxen)
-        color = GRAY_LIGHT  # Kacheln sollen immer grau sein
+        self._draw_main_temperature()
+        self._draw_main_light()
         
-        # Temperatur Widget (Touch-Bereich 1)
-        self.draw_rounded_rect(10, y_start, 90, 80, 8, color)
-        self.draw_icon_temperature(20, y_start + 10, 30, ORANGE)
-        self.draw_number(20, y_start + 45, self.sensor_data['temperature'], 2, ORANGE)
+        # Zweite Reihe: Humidity (1 Box) + Plant Health (2 Boxen)
+        self._draw_main_humidity()
+        self._draw_main_health()
         
-        # Licht Widget (erweitert über 2 Boxen) - Touch-Bereich 2 & 3
+        # Touch-Navigation-Bar unten
+        self.draw_bottom_navigation_bar()
+
+    def _draw_main_temperature(self):
+        """Temperatur Widget (Touch-Bereich 1)"""
+        y_start = 20
+        self._draw_tile('temperature', _MAIN_TEMPERATURE_RECT, self._draw_main_temperature_tile)
+        self.draw_number(20, y_start + 45, self.sensor_data['temperature'], 2, ORANGE)
+
+    def _draw_main_temperature_tile(self):
+        x, y, w, h = _MAIN_TEMPERATURE_RECT
+        self.draw_rounded_rect(x, y, w, h, 8, GRAY_LIGHT)
+        self.draw_icon_temperature(20, 30, 30, ORANGE)
+
+    def _draw_main_light(self):
+        """Licht Widget (erweitert über 2 Boxen) - Touch-Bereich 2 & 3"""
+        y_start = 20
         light_value = int(self.sensor_data['light'])
-        light_color = self.get_light_quality_color(light_value)
-        light_description = self.get_light_quality_description(light_value)
+        light_color, light_description = _light_band(light_value)
         
         # Erweiterte Lichtbox (200 Pixel breit für 2 Boxen)
-        self.draw_rounded_rect(110, y_start, 200, 80, 8, color)
+        x, y, w, h = _MAIN_LIGHT_RECT
+        self.draw_rounded_rect(x, y, w, h, 8, GRAY_LIGHT)
         self.draw_icon_sun(120, y_start + 10, 60, light_color)  # 2x größer: 30 -> 60
         
         # Lichtqualität als Text rechts neben dem Icon anzeigen (gleiche Zeile)
@@ -678,24 +1371,64 @@ class SmartPlantDisplay:
         else:
             # Kurze Beschreibungen in einer Zeile neben dem Icon
             self.draw_simple_text_2x(text_x, text_y, light_description, light_color)
-        
-        # Zweite Reihe: Humidity (1 Box) + Plant Health (2 Boxen)
-        # Luftfeuchtigkeit Widget 
-        self.draw_rounded_rect(10, y_start + 90, 90, 80, 8, color)
-        self.draw_icon_water(20, y_start + 100, 30, BLUE_LIGHT)
+
+    def _draw_main_humidity(self):
+        """Luftfeuchtigkeit Widget"""
+        y_start = 20
+        self._draw_tile('humidity', _MAIN_HUMIDITY_RECT, self._draw_main_humidity_tile)
         self.draw_number(20, y_start + 135, self.sensor_data['humidity'], 2, BLUE_LIGHT)
-        
-        # Plant Health Widget (erweitert über 2 Boxen)
-        self.draw_rounded_rect(110, y_start + 90, 200, 80, 8, color)
+
+    def _draw_main_humidity_tile(self):
+        x, y, w, h = _MAIN_HUMIDITY_RECT
+        self.draw_rounded_rect(x, y, w, h, 8, GRAY_LIGHT)
+        self.draw_icon_water(20, 120, 30, BLUE_LIGHT)
+
+    def _use_tiles(self, screen):
+        """Gibt beim Screen-Wechsel die Kacheln des vorherigen Screens frei"""
+        if self._tiles_screen != screen:
+            if self._tiles:
+                self._tiles.clear()
+                # Freigegebene Kachel sofort einsammeln, bevor die des neuen Screens
+                # (Einstellungen: 310x95 = ~29 KB am Stück) angelegt wird
+                gc.collect()
+            self._tiles_screen = screen
+
+    def _draw_tile(self, key, rect, draw):
+        """Statischen Widget-Teil einmal in einen GS8-Puffer rendern und danach nur noch blitten"""
+        x, y, w, h = rect
+        tile = self._tiles.get(key)
+        if tile is None:
+            # Wie die Navigation-Bar nur mit Streifenpuffer, sonst direkt zeichnen
+            tile = False
+            if self._strip is not None:
+                try:
+                    buf = bytearray(w * h)
+                    tile = (framebuf.FrameBuffer(buf, w, h, framebuf.GS8), memoryview(buf))
+                except MemoryError:
+                    pass
+            if tile:
+                target = (self._fb, self._fb_x, self._fb_y)
+                self._fb, self._fb_x, self._fb_y = tile[0], x, y
+                try:
+                    draw()
+                finally:
+                    self._fb, self._fb_x, self._fb_y = target
+            self._tiles[key] = tile
+        if not tile:
+            draw()
+        elif self._fb:
+            self._fb.blit(tile[0], x - self._fb_x, y - self._fb_y)
+        else:
+            self._flush_indexed(tile[1], x, y, w, h)
+
+    def _draw_main_health(self):
+        """Plant Health Widget (erweitert über 2 Boxen)"""
+        y_start = 20
+        x, y, w, h = _MAIN_HEALTH_RECT
+        self.draw_rounded_rect(x, y, w, h, 8, GRAY_LIGHT)
         health = self.sensor_data['plant_health']
+        status_color = _health_color(health)
         
-        if health > 80:
-            status_color = GREEN_LIGHT
-        elif health > 60:
-            status_color = YELLOW
-        else:
-            status_color = RED
-            
         # Gesundheits-Fortschrittsbalken
         self.draw_progress_bar(120, y_start + 110, 180, 25, health, 100, GRAY_DARK, status_color)
         
@@ -704,85 +1437,87 @@ class SmartPlantDisplay:
         
         # Gesundheitswert als Zahl rechts oben
         self.draw_number(270, y_start + 95, health, 1, status_color)
-        
-        # Touch-Navigation-Bar unten
-        self.draw_bottom_navigation_bar()
+
+    def draw_simple_text_2x(self, x, y, text, color):
+        """Zeichnet einfachen Text mit Pixel-Matrix in 2x Größe (wie draw_simple_text)"""
+        self.draw_simple_text(x, y, text, color)
 
     def show_detail_screen(self):
         """Detailansicht mit großen Sensordaten"""
+        self._use_tiles(1)
+        self.render(self._draw_detail_screen)
+
+    def _draw_detail_screen(self):
         self.fill(BLACK)
         
         # Große Anzeigen (ohne Header, starte direkt oben)
-        y = 20
+        self._draw_detail_temperature()
+        self._draw_detail_light()
+        self._draw_detail_water()
         
-        # Temperatur
+        # Touch-Navigation-Bar unten
+        self.draw_bottom_navigation_bar()
+
+    def _draw_detail_temperature(self):
+        """Temperatur-Zeile der Detailansicht"""
+        y = 20
         self.fill_rect(10, y, 300, 40, GRAY_LIGHT)
         self.draw_icon_temperature(20, y + 5, 30, ORANGE)
-        temp_str = f"{self.sensor_data['temperature']:.1f}"
-        self.draw_number(200, y + 5, float(temp_str), 3, ORANGE)
-        
-        y += 50
-        
-        # Lichtsensor-Daten mit qualitativer Anzeige
+        self.draw_number(200, y + 5, self.sensor_data['temperature'], 3, ORANGE)
+
+    def _draw_detail_light(self):
+        """Lichtsensor-Daten mit qualitativer Anzeige"""
+        y = 70
         self.fill_rect(10, y, 300, 40, GRAY_LIGHT)
         light_value = self.sensor_data['light']
-        light_color = self.get_light_quality_color(light_value)
-        light_description = self.get_light_quality_description(light_value)
+        light_color, light_description = _light_band(light_value)
         
         self.draw_icon_sun(20, y + 5, 30, light_color)
         self.draw_progress_bar(70, y + 10, 150, 20, light_value, 1000, GRAY_DARK, light_color)
         
         # Lichtqualität als Text anzeigen
         self.draw_simple_text(230, y + 15, light_description, light_color)
-        
-        y += 50
-        
-        # Wassertank-Level
+
+    def _update_detail_light(self):
+        """Nur den Lichtbalken nachziehen, solange Beschreibung und Farbe gleich bleiben"""
+        light_value = self.sensor_data['light']
+        last_value = self.last_displayed_values['light']
+        light_color, light_description = _light_band(light_value)
+        if light_description != _light_band(last_value)[1]:
+            return False
+        self.draw_progress_bar(70, 80, 150, 20, light_value, 1000, GRAY_DARK, light_color)
+        return True
+
+    def _draw_detail_water(self):
+        """Wassertank-Level"""
+        y = 120
         self.fill_rect(10, y, 300, 40, GRAY_LIGHT)
         self.draw_icon_water(20, y + 5, 30, BLUE_LIGHT)
         water_level = self.sensor_data['water_level']
         self.draw_progress_bar(70, y + 10, 200, 20, water_level, 100, GRAY_DARK, BLUE_LIGHT)
         self.draw_number(280, y + 15, water_level, 2, BLUE_LIGHT)
-        
-        # Touch-Navigation-Bar unten
-        self.draw_bottom_navigation_bar()
 
     def show_settings_screen(self):
         """Einstellungsbildschirm mit Motion-Timeout Einstellung"""
+        self._use_tiles(2)
+        self.render(self._draw_settings_screen)
+
+    def _draw_settings_screen(self):
         self.fill(BLACK)
         
-        # Header mit aktueller Motion-Timeout Anzeige
-        header_y = 10
-        self.fill_rect(10, header_y, 300, 30, GRAY_DARK)
+        # Header und Hauptbuttons mit dem aktuellen Wert
+        self._draw_settings_timeout()
         
-        # "Motion Timeout:" Text links
-        self.draw_simple_text(15, header_y + 8, "MOTION:", WHITE)
-        
-        # Aktuelle Sekunden rechts mit 7-Segment Anzeige
-        timeout_x = 200
-        self.draw_number(timeout_x, header_y + 5, self.motion_timeout_seconds, 2, WHITE)
-        # "s" für Sekunden
-        self.draw_simple_text(timeout_x + 50, header_y + 15, "s", WHITE)
-        
-        # Motion-Timeout Einstellung (große Buttons)
-        settings_y = 50
-        
-        # Minus Button (-10s)
-        self.draw_rounded_rect(20, settings_y, 60, 40, 8, RED)
-        self.draw_simple_text(35, settings_y + 18, "-10", WHITE)
-        
-        # Aktueller Wert (großer Anzeigebereich) 
-        self.draw_rounded_rect(90, settings_y, 140, 40, 8, BLUE_LIGHT)
-        # Große Anzeige der aktuellen Sekunden
-        center_x = 90 + 70 - (len(str(self.motion_timeout_seconds)) * 8)  # Zentriert
-        self.draw_number(center_x, settings_y + 10, self.motion_timeout_seconds, 3, BLACK)
-        
-        # Plus Button (+10s)
-        self.draw_rounded_rect(240, settings_y, 60, 40, 8, GREEN_LIGHT)
-        self.draw_simple_text(255, settings_y + 18, "+10", BLACK)
+        # Restliche Buttons und Info-Zeile ändern sich nie
+        self._draw_tile('settings', _SETTINGS_STATIC_RECT, self._draw_settings_static)
         
+        # Touch-Navigation-Bar unten
+        self.draw_bottom_navigation_bar()
+    
+    def _draw_settings_static(self):
+        """Feinbuttons, Presets und Info-Text der Einstellungen"""
         # Feineinstellung Buttons (±5s)
-        fine_y = settings_y + 50
+        fine_y = _SETTINGS_FINE_Y
         
         # Minus Button (-5s)
         self.draw_rounded_rect(50, fine_y, 50, 30, 5, ORANGE)
@@ -793,12 +1528,9 @@ class SmartPlantDisplay:
         self.draw_simple_text(235, fine_y + 12, "+5", BLACK)
         
         # Preset-Buttons für häufige Werte
-        preset_y = fine_y + 40
-        presets = [15, 30, 60, 120]  # 15s, 30s, 1min, 2min
-        preset_colors = [YELLOW, GREEN_LIGHT, BLUE_LIGHT, GRAY_LIGHT]
-        preset_labels = ["15s", "30s", "1m", "2m"]
+        preset_y = _SETTINGS_PRESET_Y
         
-        for i, (preset, color, label) in enumerate(zip(presets, preset_colors, preset_labels)):
+        for i, (preset, color, label) in enumerate(_SETTINGS_PRESETS):
             x = 20 + i * 70
             self.draw_rounded_rect(x, preset_y, 60, 25, 5, color)
             
@@ -810,160 +1542,9 @@ class SmartPlantDisplay:
         info_y = preset_y + 35
         self.fill_rect(10, info_y, 300, 20, GRAY_DARK)
         self.draw_simple_text(15, info_y + 6, "Touch buttons to change timeout", WHITE)
-        
-        # Touch-Navigation-Bar unten
-        self.draw_bottom_navigation_bar()
     
-    def draw_simple_text(self, x, y, text, color):
-        """Zeichnet einfachen Text mit Pixel-Matrix"""
-        # Vereinfachte 5x7 Pixel-Font für wichtige Zeichen
-        font = {
-            'A': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'B': [[1,1,1,1,0], [1,0,0,0,1], [1,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            'C': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'D': [[1,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            'E': [[1,1,1,1,1], [1,0,0,0,0], [1,1,1,1,0], [1,0,0,0,0], [1,0,0,0,0], [1,1,1,1,1], [0,0,0,0,0]],
-            'F': [[1,1,1,1,1], [1,0,0,0,0], [1,1,1,1,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [0,0,0,0,0]],
-            'G': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,0], [1,0,1,1,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'H': [[1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'I': [[0,1,1,1,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,1,1,1,0], [0,0,0,0,0]],
-            'K': [[1,0,0,0,1], [1,0,0,1,0], [1,0,1,0,0], [1,1,0,0,0], [1,0,1,0,0], [1,0,0,1,0], [0,0,0,0,0]],
-            'L': [[1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [1,1,1,1,1], [0,0,0,0,0]],
-            'M': [[1,0,0,0,1], [1,1,0,1,1], [1,0,1,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'N': [[1,0,0,0,1], [1,1,0,0,1], [1,0,1,0,1], [1,0,0,1,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'O': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'P': [[1,1,1,1,0], [1,0,0,0,1], [1,1,1,1,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [0,0,0,0,0]],
-            'R': [[1,1,1,1,0], [1,0,0,0,1], [1,1,1,1,0], [1,0,1,0,0], [1,0,0,1,0], [1,0,0,0,1], [0,0,0,0,0]],
-            'S': [[0,1,1,1,1], [1,0,0,0,0], [0,1,1,1,0], [0,0,0,0,1], [0,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            'T': [[1,1,1,1,1], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,0,0,0]],
-            'U': [[1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'V': [[1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,0,1,0], [0,0,1,0,0], [0,0,0,0,0]],
-            'Y': [[1,0,0,0,1], [1,0,0,0,1], [0,1,0,1,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,0,0,0]],
-            '0': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            '1': [[0,0,1,0,0], [0,1,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,1,1,1,0], [0,0,0,0,0]],
-            '2': [[0,1,1,1,0], [1,0,0,0,1], [0,0,0,1,0], [0,0,1,0,0], [0,1,0,0,0], [1,1,1,1,1], [0,0,0,0,0]],
-            '3': [[1,1,1,1,0], [0,0,0,0,1], [0,1,1,1,0], [0,0,0,0,1], [0,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            '4': [[1,0,0,1,0], [1,0,0,1,0], [1,0,0,1,0], [1,1,1,1,1], [0,0,0,1,0], [0,0,0,1,0], [0,0,0,0,0]],
-            '5': [[1,1,1,1,1], [1,0,0,0,0], [1,1,1,1,0], [0,0,0,0,1], [0,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            '+': [[0,0,0,0,0], [0,0,1,0,0], [0,1,1,1,0], [0,0,1,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-            '-': [[0,0,0,0,0], [0,0,0,0,0], [0,1,1,1,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-            's': [[0,0,0,0,0], [0,1,1,1,0], [1,0,0,0,0], [0,1,1,0,0], [0,0,0,1,0], [1,1,1,0,0], [0,0,0,0,0]],
-            'm': [[0,0,0,0,0], [1,1,0,1,0], [1,0,1,0,1], [1,0,1,0,1], [1,0,1,0,1], [1,0,1,0,1], [0,0,0,0,0]],
-            'X': [[1,0,0,0,1], [0,1,0,1,0], [0,0,1,0,0], [0,0,1,0,0], [0,1,0,1,0], [1,0,0,0,1], [0,0,0,0,0]],
-            ' ': [[0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-            ':': [[0,0,0,0,0], [0,0,1,0,0], [0,0,0,0,0], [0,0,1,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-        }
-        
-        char_x = x
-        for char in text.upper():
-            if char in font:
-                char_pattern = font[char]
-                for row_idx, row in enumerate(char_pattern):
-                    for col_idx, pixel in enumerate(row):
-                        if pixel:
-                            self.pixel(char_x + col_idx, y + row_idx, color)
-                char_x += 6  # 5 pixels width + 1 pixel spacing
-            else:
-                char_x += 6  # Fallback für unbekannte Zeichen
-
-    def draw_simple_text_2x(self, x, y, text, color):
-        """Zeichnet einfachen Text mit Pixel-Matrix in 2x Größe"""
-        # Vereinfachte 5x7 Pixel-Font für wichtige Zeichen (gleiche wie draw_simple_text)
-        font = {
-            'A': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'B': [[1,1,1,1,0], [1,0,0,0,1], [1,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            'C': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'D': [[1,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            'E': [[1,1,1,1,1], [1,0,0,0,0], [1,1,1,1,0], [1,0,0,0,0], [1,0,0,0,0], [1,1,1,1,1], [0,0,0,0,0]],
-            'F': [[1,1,1,1,1], [1,0,0,0,0], [1,1,1,1,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [0,0,0,0,0]],
-            'G': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,0], [1,0,1,1,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'H': [[1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'I': [[0,1,1,1,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,1,1,1,0], [0,0,0,0,0]],
-            'K': [[1,0,0,0,1], [1,0,0,1,0], [1,0,1,0,0], [1,1,0,0,0], [1,0,1,0,0], [1,0,0,1,0], [0,0,0,0,0]],
-            'L': [[1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [1,1,1,1,1], [0,0,0,0,0]],
-            'M': [[1,0,0,0,1], [1,1,0,1,1], [1,0,1,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'N': [[1,0,0,0,1], [1,1,0,0,1], [1,0,1,0,1], [1,0,0,1,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'O': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'P': [[1,1,1,1,0], [1,0,0,0,1], [1,1,1,1,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [0,0,0,0,0]],
-            'R': [[1,1,1,1,0], [1,0,0,0,1], [1,1,1,1,0], [1,0,1,0,0], [1,0,0,1,0], [1,0,0,0,1], [0,0,0,0,0]],
-            'S': [[0,1,1,1,1], [1,0,0,0,0], [0,1,1,1,0], [0,0,0,0,1], [0,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            'T': [[1,1,1,1,1], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,0,0,0]],
-            'U': [[1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'V': [[1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,0,1,0], [0,0,1,0,0], [0,0,0,0,0]],
-            'Y': [[1,0,0,0,1], [1,0,0,0,1], [0,1,0,1,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,0,0,0]],
-            '0': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            '1': [[0,0,1,0,0], [0,1,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,1,1,1,0], [0,0,0,0,0]],
-            '2': [[0,1,1,1,0], [1,0,0,0,1], [0,0,0,1,0], [0,0,1,0,0], [0,1,0,0,0], [1,1,1,1,1], [0,0,0,0,0]],
-            '3': [[1,1,1,1,0], [0,0,0,0,1], [0,1,1,1,0], [0,0,0,0,1], [0,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            '4': [[1,0,0,1,0], [1,0,0,1,0], [1,0,0,1,0], [1,1,1,1,1], [0,0,0,1,0], [0,0,0,1,0], [0,0,0,0,0]],
-            '5': [[1,1,1,1,1], [1,0,0,0,0], [1,1,1,1,0], [0,0,0,0,1], [0,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            '+': [[0,0,0,0,0], [0,0,1,0,0], [0,1,1,1,0], [0,0,1,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-            '-': [[0,0,0,0,0], [0,0,0,0,0], [0,1,1,1,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-            's': [[0,0,0,0,0], [0,1,1,1,0], [1,0,0,0,0], [0,1,1,0,0], [0,0,0,1,0], [1,1,1,0,0], [0,0,0,0,0]],
-            'm': [[0,0,0,0,0], [1,1,0,1,0], [1,0,1,0,1], [1,0,1,0,1], [1,0,1,0,1], [1,0,1,0,1], [0,0,0,0,0]],
-            'X': [[1,0,0,0,1], [0,1,0,1,0], [0,0,1,0,0], [0,0,1,0,0], [0,1,0,1,0], [1,0,0,0,1], [0,0,0,0,0]],
-            ' ': [[0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-            ':': [[0,0,0,0,0], [0,0,1,0,0], [0,0,0,0,0], [0,0,1,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-        }
-        
-        char_x = x
-        for char in text.upper():
-            if char in font:
-                char_pattern = font[char]
-                for row_idx, row in enumerate(char_pattern):
-                    for col_idx, pixel in enumerate(row):
-                        if pixel:
-                            # Zeichne 2x2 Pixel Block für jeden ursprünglichen Pixel
-                            for dx in range(2):
-                                for dy in range(2):
-                                    self.pixel(char_x + col_idx*2 + dx, y + row_idx*2 + dy, color)
-                char_x += 12  # (5 pixels width + 1 pixel spacing) * 2
-            else:
-                char_x += 12  # Fallback für unbekannte Zeichen
-
-    def show_detail_screen(self):
-        """Detailansicht mit großen Sensordaten"""
-        self.fill(BLACK)
-        
-        # Große Anzeigen (ohne Header, starte direkt oben)
-        y = 20
-        
-        # Temperatur
-        self.fill_rect(10, y, 300, 40, GRAY_LIGHT)
-        self.draw_icon_temperature(20, y + 5, 30, ORANGE)
-        temp_str = f"{self.sensor_data['temperature']:.1f}"
-        self.draw_number(200, y + 5, float(temp_str), 3, ORANGE)
-        
-        y += 50
-        
-        # Lichtsensor-Daten mit qualitativer Anzeige
-        self.fill_rect(10, y, 300, 40, GRAY_LIGHT)
-        light_value = self.sensor_data['light']
-        light_color = self.get_light_quality_color(light_value)
-        light_description = self.get_light_quality_description(light_value)
-        
-        self.draw_icon_sun(20, y + 5, 30, light_color)
-        self.draw_progress_bar(70, y + 10, 150, 20, light_value, 1000, GRAY_DARK, light_color)
-        
-        # Lichtqualität als Text anzeigen
-        self.draw_simple_text(230, y + 15, light_description, light_color)
-        
-        y += 50
-        
-        # Wassertank-Level
-        self.fill_rect(10, y, 300, 40, GRAY_LIGHT)
-        self.draw_icon_water(20, y + 5, 30, BLUE_LIGHT)
-        water_level = self.sensor_data['water_level']
-        self.draw_progress_bar(70, y + 10, 200, 20, water_level, 100, GRAY_DARK, BLUE_LIGHT)
-        self.draw_number(280, y + 15, water_level, 2, BLUE_LIGHT)
-        
-        # Touch-Navigation-Bar unten
-        self.draw_bottom_navigation_bar()
-
-    def show_settings_screen(self):
-        """Einstellungsbildschirm mit Motion-Timeout Einstellung"""
-        self.fill(BLACK)
-        
+    def _draw_settings_timeout(self):
+        """Motion-Timeout Header und Hauptbuttons (-10 / Wert / +10)"""
         # Header mit aktueller Motion-Timeout Anzeige
         header_y = 10
         self.fill_rect(10, header_y, 300, 30, GRAY_DARK)
@@ -978,7 +1559,7 @@ class SmartPlantDisplay:
         self.draw_simple_text(timeout_x + 50, header_y + 15, "s", WHITE)
         
         # Motion-Timeout Einstellung (große Buttons)
-        settings_y = 50
+        settings_y = _SETTINGS_MAIN_Y
         
         # Minus Button (-10s)
         self.draw_rounded_rect(20, settings_y, 60, 40, 8, RED)
@@ -987,249 +1568,190 @@ class SmartPlantDisplay:
         # Aktueller Wert (großer Anzeigebereich) 
         self.draw_rounded_rect(90, settings_y, 140, 40, 8, BLUE_LIGHT)
         # Große Anzeige der aktuellen Sekunden
-        center_x = 90 + 70 - (len(str(self.motion_timeout_seconds)) * 8)  # Zentriert
+        # Stellenzahl ohne str() (Timeout liegt zwischen 5 und 300 Sekunden)
+        seconds = self.motion_timeout_seconds
+        center_x = 90 + 70 - (1 + (seconds >= 10) + (seconds >= 100)) * 8  # Zentriert
         self.draw_number(center_x, settings_y + 10, self.motion_timeout_seconds, 3, BLACK)
         
         # Plus Button (+10s)
         self.draw_rounded_rect(240, settings_y, 60, 40, 8, GREEN_LIGHT)
         self.draw_simple_text(255, settings_y + 18, "+10", BLACK)
-        
-        # Feineinstellung Buttons (±5s)
-        fine_y = settings_y + 50
-        
-        # Minus Button (-5s)
-        self.draw_rounded_rect(50, fine_y, 50, 30, 5, ORANGE)
-        self.draw_simple_text(65, fine_y + 12, "-5", BLACK)
-        
-        # Plus Button (+5s)
-        self.draw_rounded_rect(220, fine_y, 50, 30, 5, ORANGE)
-        self.draw_simple_text(235, fine_y + 12, "+5", BLACK)
-        
-        # Preset-Buttons für häufige Werte
-        preset_y = fine_y + 40
-        presets = [15, 30, 60, 120]  # 15s, 30s, 1min, 2min
-        preset_colors = [YELLOW, GREEN_LIGHT, BLUE_LIGHT, GRAY_LIGHT]
-        preset_labels = ["15s", "30s", "1m", "2m"]
-        
-        for i, (preset, color, label) in enumerate(zip(presets, preset_colors, preset_labels)):
-            x = 20 + i * 70
-            self.draw_rounded_rect(x, preset_y, 60, 25, 5, color)
-            
-            # Preset-Label zentriert
-            label_x = x + 30 - (len(label) * 4)
-            self.draw_simple_text(label_x, preset_y + 10, label, BLACK)
-        
-        # Info-Text
-        info_y = preset_y + 35
-        self.fill_rect(10, info_y, 300, 20, GRAY_DARK)
-        self.draw_simple_text(15, info_y + 6, "Touch buttons to change timeout", WHITE)
-        
-        # Touch-Navigation-Bar unten
-        self.draw_bottom_navigation_bar()
-    
+
     def draw_simple_text(self, x, y, text, color):
-        """Zeichnet einfachen Text mit Pixel-Matrix"""
-        # Vereinfachte 5x7 Pixel-Font für wichtige Zeichen
-        font = {
-            'A': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'B': [[1,1,1,1,0], [1,0,0,0,1], [1,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            'C': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'D': [[1,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            'E': [[1,1,1,1,1], [1,0,0,0,0], [1,1,1,1,0], [1,0,0,0,0], [1,0,0,0,0], [1,1,1,1,1], [0,0,0,0,0]],
-            'F': [[1,1,1,1,1], [1,0,0,0,0], [1,1,1,1,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [0,0,0,0,0]],
-            'G': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,0], [1,0,1,1,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'H': [[1,0,0,0,1], [1,0,0,0,1], [1,1,1,1,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'I': [[0,1,1,1,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,1,1,1,0], [0,0,0,0,0]],
-            'K': [[1,0,0,0,1], [1,0,0,1,0], [1,0,1,0,0], [1,1,0,0,0], [1,0,1,0,0], [1,0,0,1,0], [0,0,0,0,0]],
-            'L': [[1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [1,1,1,1,1], [0,0,0,0,0]],
-            'M': [[1,0,0,0,1], [1,1,0,1,1], [1,0,1,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'N': [[1,0,0,0,1], [1,1,0,0,1], [1,0,1,0,1], [1,0,0,1,1], [1,0,0,0,1], [1,0,0,0,1], [0,0,0,0,0]],
-            'O': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'P': [[1,1,1,1,0], [1,0,0,0,1], [1,1,1,1,0], [1,0,0,0,0], [1,0,0,0,0], [1,0,0,0,0], [0,0,0,0,0]],
-            'R': [[1,1,1,1,0], [1,0,0,0,1], [1,1,1,1,0], [1,0,1,0,0], [1,0,0,1,0], [1,0,0,0,1], [0,0,0,0,0]],
-            'S': [[0,1,1,1,1], [1,0,0,0,0], [0,1,1,1,0], [0,0,0,0,1], [0,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            'T': [[1,1,1,1,1], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,0,0,0]],
-            'U': [[1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            'V': [[1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,0,1,0], [0,0,1,0,0], [0,0,0,0,0]],
-            'Y': [[1,0,0,0,1], [1,0,0,0,1], [0,1,0,1,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,0,0,0]],
-            '0': [[0,1,1,1,0], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [1,0,0,0,1], [0,1,1,1,0], [0,0,0,0,0]],
-            '1': [[0,0,1,0,0], [0,1,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,0,1,0,0], [0,1,1,1,0], [0,0,0,0,0]],
-            '2': [[0,1,1,1,0], [1,0,0,0,1], [0,0,0,1,0], [0,0,1,0,0], [0,1,0,0,0], [1,1,1,1,1], [0,0,0,0,0]],
-            '3': [[1,1,1,1,0], [0,0,0,0,1], [0,1,1,1,0], [0,0,0,0,1], [0,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            '4': [[1,0,0,1,0], [1,0,0,1,0], [1,0,0,1,0], [1,1,1,1,1], [0,0,0,1,0], [0,0,0,1,0], [0,0,0,0,0]],
-            '5': [[1,1,1,1,1], [1,0,0,0,0], [1,1,1,1,0], [0,0,0,0,1], [0,0,0,0,1], [1,1,1,1,0], [0,0,0,0,0]],
-            '+': [[0,0,0,0,0], [0,0,1,0,0], [0,1,1,1,0], [0,0,1,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-            '-': [[0,0,0,0,0], [0,0,0,0,0], [0,1,1,1,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-            's': [[0,0,0,0,0], [0,1,1,1,0], [1,0,0,0,0], [0,1,1,0,0], [0,0,0,1,0], [1,1,1,0,0], [0,0,0,0,0]],
-            'm': [[0,0,0,0,0], [1,1,0,1,0], [1,0,1,0,1], [1,0,1,0,1], [1,0,1,0,1], [1,0,1,0,1], [0,0,0,0,0]],
-            'X': [[1,0,0,0,1], [0,1,0,1,0], [0,0,1,0,0], [0,0,1,0,0], [0,1,0,1,0], [1,0,0,0,1], [0,0,0,0,0]],
-            ' ': [[0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-            ':': [[0,0,0,0,0], [0,0,1,0,0], [0,0,0,0,0], [0,0,1,0,0], [0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]],
-        }
+        """Zeichnet einfachen Text mit Pixel-Matrix (5x7-Font, 2x skaliert)"""
+        if not text:
+            return
+        if self._fb:
+            # Vorgerenderte Textmaske mit einem blit einfärben
+            self._blit_mask(self._text_sprite(text), x, y, color)
+            return
         
         char_x = x
         for char in text.upper():
-            if char in font:
-                char_pattern = font[char]
-                for row_idx, row in enumerate(char_pattern):
-                    for col_idx, pixel in enumerate(row):
-                        if pixel:
-                            # Zeichne 2x2 Pixel Block für jeden ursprünglichen Pixel
-                            for dx in range(2):
-                                for dy in range(2):
-                                    self.pixel(char_x + col_idx*2 + dx, y + row_idx*2 + dy, color)
+            if char in _FONT_5X7:
+                char_pattern = _FONT_5X7[char]
+                for row_idx, bits in enumerate(char_pattern):
+                    py = y + row_idx*2
+                    if py < 0:
+                        continue
+                    # Ein 2 Pixel hohes Rechteck pro Lauf statt eines Blocks pro Pixel
+                    for col_idx, run in _FONT_ROW_RUNS[bits]:
+                        px = char_x + col_idx*2
+                        pw = run*2
+                        if px < 0:
+                            pw += px
+                            px = 0
+                        self.fill_rect(px, py, pw, 2, color)
                 char_x += 12  # (5 pixels width + 1 pixel spacing) * 2
             else:
                 char_x += 12  # Fallback für unbekannte Zeichen
 
+    def _text_sprite(self, text):
+        """1-Bit-Maske eines Textes, pro Text einmalig erzeugt (UI-Texte sind fest)"""
+        sprite = self._text_cache.get(text)
+        if sprite is None:
+            w = len(text) * 12
+            sprite = framebuf.FrameBuffer(bytearray(((w + 7) // 8) * 14), w, 14, framebuf.MONO_HLSB)
+            for i, char in enumerate(text.upper()):
+                char_pattern = _FONT_5X7.get(char)
+                if char_pattern:
+                    for row_idx, bits in enumerate(char_pattern):
+                        for col_idx, run in _FONT_ROW_RUNS[bits]:
+                            sprite.fill_rect(i*12 + col_idx*2, row_idx*2, run*2, 2, 1)
+            self._text_cache[text] = sprite
+        return sprite
+
     def update_sensor_data(self):
-        """Aktualisiert Sensordaten - kombiniert echte und simulierte Werte"""
-        
-        # Echte Lichtsensor-Daten lesen (GP28)
+        """Fragt alle Sensoren sofort ab - kombiniert echte und simulierte Werte"""
+        self._poll_light()
+        self._poll_dht()
+        self._poll_motion()
+        self._update_health()
+
+    def _poll_light(self):
+        """Liest den Lichtsensor (GP28) und merkt Änderungen vor, True wenn sich der Wert geändert hat"""
         light_value, light_voltage, light_raw = self.read_light_sensor()
-        
-        # Echte Temperatur/Feuchtigkeits-Daten lesen (GP26)
-        real_temp, real_humidity = self.read_temp_humidity_sensor()
-        
-        # Motion-Sensor Status lesen (GP27) - jetzt mit 30s Timeout
-        motion_detected = self.read_motion_sensor()
-        # Motion-Handling ist jetzt in der read_motion_sensor() Funktion integriert
-        
-        # Prüfen ob sich Werte geändert haben
-        values_changed = False
+        sensor_data = self.sensor_data
+        if light_value == sensor_data['light']:
+            # Gleicher Lux-Wert: Rauschen im Rohwert nicht ins Dict schreiben
+            return False
         
         # Lichtwerte prüfen (Toleranz von 5 Lux)
         if abs(light_value - self.last_light_value) > 5:
             self.data_needs_update = True
-            values_changed = True
-            print(f"Lichtwert geändert: {self.last_light_value} -> {light_value}")
+            if _DEBUG:
+                print(f"Lichtwert geändert: {self.last_light_value} -> {light_value}")
+        
+        sensor_data['light'] = light_value
+        sensor_data['light_voltage'] = light_voltage
+        sensor_data['light_raw'] = light_raw
+        self.last_light_value = light_value
+        return True
+
+    def _poll_dht(self):
+        """Liest Temperatur/Feuchtigkeit (DHT11), simuliert sie ohne Sensor, True bei Änderung"""
+        real_temp, real_humidity = self.read_temp_humidity_sensor()
+        
+        # Werte einmal in Locals holen, am Ende zurückschreiben
+        sensor_data = self.sensor_data
+        temperature = sensor_data['temperature']
+        humidity = sensor_data['humidity']
         
         # Echte Sensordaten verwenden falls verfügbar, sonst simulierte Werte
         if real_temp is not None:
-            if abs(real_temp - self.sensor_data['temperature']) > 0.1:
-                self.sensor_data['temperature'] = real_temp
-                values_changed = True
+            if abs(real_temp - temperature) > 0.1:
+                temperature = real_temp
         else:
             # Simuliere Temperatur falls Sensor nicht verfügbar
-            self.sensor_data['temperature'] += random.uniform(-0.5, 0.5)
-            self.sensor_data['temperature'] = max(15, min(35, self.sensor_data['temperature']))
+            temperature = max(15, min(35, temperature + _rand_uniform(-0.5, 0.5)))
         
         if real_humidity is not None:
-            if abs(real_humidity - self.sensor_data['humidity']) > 1:
-                self.sensor_data['humidity'] = real_humidity
-                values_changed = True
+            if abs(real_humidity - humidity) > 1:
+                humidity = real_humidity
         else:
             # Simuliere Luftfeuchtigkeit falls Sensor nicht verfügbar
-            self.sensor_data['humidity'] += random.uniform(-2, 2)
-            self.sensor_data['humidity'] = max(30, min(90, self.sensor_data['humidity']))
+            humidity = max(30, min(90, humidity + _rand_uniform(-2, 2)))
         
-        # Prüfen ob andere Werte Update brauchen
-        if (abs(self.sensor_data['temperature'] - self.last_displayed_values.get('temperature', 0)) > 0.1 or
-            abs(self.sensor_data['humidity'] - self.last_displayed_values.get('humidity', 0)) > 1):
-            self.data_needs_update = True
+        if temperature == sensor_data['temperature'] and humidity == sensor_data['humidity']:
+            return False
         
-        self.sensor_data['light'] = light_value
-        self.sensor_data['light_voltage'] = light_voltage
-        self.sensor_data['light_raw'] = light_raw
-        self.last_light_value = light_value
+        sensor_data['temperature'] = temperature
+        sensor_data['humidity'] = humidity
+        return True
+
+    def _poll_motion(self):
+        """Liest den Motion-Sensor, Timeout und Audio laufen in read_motion_sensor()"""
+        self.read_motion_sensor()
+        return False  # Ändert keine angezeigten Sensordaten
+
+    def _update_health(self):
+        """Berechnet die Pflanzengesundheit neu und merkt geänderte Widgets vor"""
+        sensor_data = self.sensor_data
+        temperature = sensor_data['temperature']
+        humidity = sensor_data['humidity']
+        light_value = sensor_data['light']
         
         # Debug-Ausgabe für alle Sensoren
-        print(f"Sensoren - Licht: {light_value} Lux ({light_voltage:.2f}V), Temp: {self.sensor_data['temperature']:.1f}°C, Humidity: {self.sensor_data['humidity']:.1f}%")
+        if _DEBUG:
+            print(f"Sensoren - Licht: {light_value} Lux ({sensor_data['light_voltage']:.2f}V), Temp: {temperature:.1f}°C, Humidity: {humidity:.1f}%")
         
         # Berechne Pflanzengesundheit basierend auf echten Sensordaten
         health = 100
-        if self.sensor_data['temperature'] < 18 or self.sensor_data['temperature'] > 28:
+        if temperature < 18 or temperature > 28:
             health -= 15
         if light_value < 300:  # Verwende echte Lichtwerte
             health -= 20
-        if self.sensor_data['humidity'] < 40 or self.sensor_data['humidity'] > 80:
+        if humidity < 40 or humidity > 80:
             health -= 15
         
-        self.sensor_data['plant_health'] = max(0, min(100, health))
+        sensor_data['plant_health'] = max(0, min(100, health))
+        
+        # Geänderte Widgets für das Teil-Update vormerken
+        self.mark_dirty_widgets()
 
     def handle_touch(self, x, y):
         """Behandelt Touch-Eingaben basierend auf aktuellem Screen"""
-        print(f"Touch at: {x}, {y} on screen {self.current_screen}")
+        if _DEBUG:
+            print(f"Touch at: {x}, {y} on screen {self.current_screen}")
         
         # Touch aktiviert manuellen Modus
         old_screen = self.current_screen
         self.manual_mode = True
         self.last_touch_time = time.ticks_ms()
         
-        # Navigation-Bar Touch-Bereiche (unten)
-        nav_y = self.height - 40  # Navigation-Bar ist 40px hoch
-        if y >= nav_y:
-            button_width = self.width // 2
-            if x < button_width:  # Dashboard Button
-                self.current_screen = 0
-            else:  # Settings Button  
-                self.current_screen = 2
-        else:
-            # Touch in den Hauptbereichen der verschiedenen Screens
-            if self.current_screen == 0:  # Main Screen
-                # Widget-Bereiche prüfen (angepasste Y-Koordinaten wegen fehlendem Header)
-                if 20 <= y <= 100:  # Erste Widget-Reihe
-                    if 10 <= x <= 100:      # Temperatur-Widget
-                        self.current_screen = 1  # Zu Details
-                    elif 110 <= x <= 200:   # Humidity-Widget  
-                        self.current_screen = 1
-                    elif 210 <= x <= 300:   # Soil-Widget
-                        self.current_screen = 1
-                elif 110 <= y <= 190:  # Zweite Widget-Reihe  
-                    if 10 <= x <= 100:      # Licht-Widget
-                        self.current_screen = 1  # Zu Details
-                    elif 110 <= x <= 300:   # Pflanzenstatus-Widget
-                        self.current_screen = 1
-                        
-            elif self.current_screen == 1:  # Detail Screen
-                # Tippen irgendwo (außer Navigation-Bar) geht zurück zum Dashboard
-                self.current_screen = 0
-                    
-            elif self.current_screen == 2:  # Settings Screen  
-                # Motion-Timeout Einstellungen
-                settings_y = 50
-                fine_y = settings_y + 50
-                preset_y = fine_y + 40
-                
-                if settings_y <= y <= settings_y + 40:  # Hauptbuttons
-                    if 20 <= x <= 80:  # -10s Button
-                        self.motion_timeout_seconds = max(5, self.motion_timeout_seconds - 10)
-                        self.motion_timeout = self.motion_timeout_seconds * 1000
-                        print(f"Motion-Timeout auf {self.motion_timeout_seconds}s gesetzt")
-                        self.screen_needs_redraw = True
-                    elif 240 <= x <= 300:  # +10s Button
-                        self.motion_timeout_seconds = min(300, self.motion_timeout_seconds + 10)
-                        self.motion_timeout = self.motion_timeout_seconds * 1000
-                        print(f"Motion-Timeout auf {self.motion_timeout_seconds}s gesetzt")
-                        self.screen_needs_redraw = True
-                        
-                elif fine_y <= y <= fine_y + 30:  # Feineinstellung
-                    if 50 <= x <= 100:  # -5s Button
-                        self.motion_timeout_seconds = max(5, self.motion_timeout_seconds - 5)
-                        self.motion_timeout = self.motion_timeout_seconds * 1000
-                        print(f"Motion-Timeout auf {self.motion_timeout_seconds}s gesetzt")
-                        self.screen_needs_redraw = True
-                    elif 220 <= x <= 270:  # +5s Button
-                        self.motion_timeout_seconds = min(300, self.motion_timeout_seconds + 5)
-                        self.motion_timeout = self.motion_timeout_seconds * 1000
-                        print(f"Motion-Timeout auf {self.motion_timeout_seconds}s gesetzt")
-                        self.screen_needs_redraw = True
-                        
-                elif preset_y <= y <= preset_y + 25:  # Preset-Buttons
-                    presets = [15, 30, 60, 120]
-                    for i, preset in enumerate(presets):
-                        button_x = 20 + i * 70
-                        if button_x <= x <= button_x + 60:
-                            self.motion_timeout_seconds = preset
-                            self.motion_timeout = preset * 1000
-                            print(f"Motion-Timeout Preset auf {preset}s gesetzt")
-                            self.screen_needs_redraw = True
-                            break
+        # Erster Touch-Bereich des Screens, der (x, y) enthält, löst seine Aktion aus
+        for x0, x1, y0, y1, action, arg in self._hit_regions[self.current_screen]:
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                action(arg)
+                break
         
         # Screen hat sich geändert - neu zeichnen erforderlich
         if old_screen != self.current_screen:
             self.screen_needs_redraw = True
 
+    def _go_to_screen(self, screen):
+        self.current_screen = screen
+
+    def _change_motion_timeout(self, delta):
+        """Motion-Timeout um delta Sekunden ändern (5-300s)"""
+        self.motion_timeout_seconds = max(5, min(300, self.motion_timeout_seconds + delta))
+        self.motion_timeout = self.motion_timeout_seconds * 1000
+        if _DEBUG:
+            print(f"Motion-Timeout auf {self.motion_timeout_seconds}s gesetzt")
+        self._mark_settings_dirty()
+
+    def _set_motion_timeout_preset(self, preset):
+        self.motion_timeout_seconds = preset
+        self.motion_timeout = preset * 1000
+        if _DEBUG:
+            print(f"Motion-Timeout Preset auf {preset}s gesetzt")
+        self._mark_settings_dirty()
+
+    def _mark_settings_dirty(self):
+        """Nur den Timeout-Bereich der Settings neu zeichnen statt des ganzen Screens"""
+        self.dirty_widgets.add('motion_timeout')
+        self.data_needs_update = True
+
     def check_auto_mode_timeout(self):
         """Prüft ob nach Touch-Timeout wieder in Auto-Modus gewechselt werden soll"""
         if self.manual_mode:
@@ -1240,70 +1762,129 @@ class SmartPlantDisplay:
 
     def run_ui(self):
         """Hauptschleife für das UI mit Touch-Unterstützung"""
-        screen_count = 2  # Nur Dashboard (0) und Settings (2)
-        last_screen_change = time.ticks_ms()
+        # Häufig benutzte Funktionen einmal binden statt pro Durchlauf nachzuschlagen
+        ticks_ms = time.ticks_ms
+        ticks_diff = time.ticks_diff
+        ticks_add = time.ticks_add
+        sleep_ms = time.sleep_ms
+        touch = self.touch
+        show_screen = {0: self.show_main_screen, 1: self.show_detail_screen, 2: self.show_settings_screen}
+        last_displayed = self.last_displayed_values
+        sensor_data = self.sensor_data
+        
+        last_screen_change = ticks_ms()
         screen_duration = 180000  # 3 Minuten pro Screen (nur im Auto-Modus)
-        last_touch_pos = None
+        # Touch-Entprellung: Rohzustand puffern, Timer bei jedem Wechsel neu starten
+        # und erst auslösen, wenn der Zustand _TOUCH_DEBOUNCE_MS lang stabil war
+        raw_pressed = False
+        raw_since = ticks_ms()
+        released_at = ticks_ms()  # Beginn des letzten Loslassens
+        touch_pos = None
+        committed = False  # Für diesen Druck schon ausgelöst
+        # Startwerte einmal komplett einlesen, danach nur noch bei Änderungen neu berechnen
+        self.update_sensor_data()
+        next_poll = self._next_poll
+        pollers = (('light', self._poll_light), ('dht', self._poll_dht), ('motion', self._poll_motion))
         
         try:
             while True:
-                current_time = time.ticks_ms()
+                current_time = ticks_ms()
                 
                 # Touch-Input prüfen
-                if self.touch:
-                    touch_pos = self.touch.get_touch()
-                    if touch_pos and touch_pos != last_touch_pos:
+                if touch:
+                    pos = touch.get_touch()
+                    if (pos is not None) != raw_pressed:
+                        raw_pressed = pos is not None
+                        raw_since = current_time
+                        if not raw_pressed:
+                            released_at = current_time
+                        elif committed and ticks_diff(current_time, released_at) >= _TOUCH_DEBOUNCE_MS:
+                            # Lang genug losgelassen: neuer Druck, auch wenn kein Durchlauf
+                            # das Loslassen als stabil gesehen hat
+                            committed = False
+                    if pos:
+                        touch_pos = pos
+                    stable = ticks_diff(current_time, raw_since) >= _TOUCH_DEBOUNCE_MS
+                    if not raw_pressed:
+                        if stable:
+                            committed = False
+                    elif (stable and not committed and
+                          ticks_diff(current_time, self._last_touch_commit_ms) >= _TOUCH_DEBOUNCE_MS):
                         x, y = touch_pos
                         self.handle_touch(x, y)
-                        last_touch_pos = touch_pos
-                    elif not touch_pos:
-                        last_touch_pos = None
+                        self._last_touch_commit_ms = current_time
+                        committed = True
                 
                 # Auto-Modus Timeout prüfen
                 self.check_auto_mode_timeout()
                 
-                # Sensordaten alle 5 Sekunden aktualisieren (weniger häufig)
-                if time.ticks_diff(current_time, self.last_update) > 5000:
-                    self.update_sensor_data()
-                    self.last_update = current_time
+                # Jeden Sensor in seinem eigenen Intervall abfragen, abgeleitete Werte
+                # nur neu berechnen, wenn sich ein Messwert tatsächlich geändert hat
+                changed = False
+                for key, poll in pollers:
+                    if ticks_diff(current_time, next_poll[key]) >= 0:
+                        if poll():
+                            changed = True
+                        next_poll[key] = ticks_add(current_time, _SENSOR_POLL_MS[key])
+                        self.last_update = current_time
+                if changed:
+                    self._update_health()
                 
                 # Screen nur neu zeichnen wenn wirklich nötig (Screen-Wechsel oder erste Anzeige)
                 if self.screen_needs_redraw or self.last_drawn_screen != self.current_screen:
-                    if self.current_screen == 0:
-                        self.show_main_screen()
-                    elif self.current_screen == 1:
-                        self.show_detail_screen()
-                    else:
-                        self.show_settings_screen()
+                    show_screen.get(self.current_screen, self.show_settings_screen)()
                     
                     # Angezeigte Werte zurücksetzen nach kompletter Neuzeichnung
-                    for key in self.last_displayed_values:
-                        self.last_displayed_values[key] = self.sensor_data.get(key, 0)
+                    for key in last_displayed:
+                        last_displayed[key] = sensor_data.get(key, 0)
                     
                     self.last_drawn_screen = self.current_screen
                     self.screen_needs_redraw = False
                     self.data_needs_update = False
-                    print(f"Screen {self.current_screen} komplett neu gezeichnet")
+                    self.dirty_widgets.clear()
+                    if _DEBUG:
+                        print(f"Screen {self.current_screen} komplett neu gezeichnet")
                     
                 # Nur Daten-Updates ohne komplettes Redraw
                 elif self.data_needs_update:
                     self.update_display_values_only()
                     self.data_needs_update = False
-                    print("Nur Sensordaten aktualisiert (kein komplettes Redraw)")
+                    if _DEBUG:
+                        print("Nur Sensordaten aktualisiert (kein komplettes Redraw)")
                 
                 # Screen nur im Auto-Modus automatisch wechseln (nur zwischen 0 und 2)
-                if not self.manual_mode and time.ticks_diff(current_time, last_screen_change) > screen_duration:
+                if not self.manual_mode and ticks_diff(current_time, last_screen_change) > screen_duration:
                     old_screen = self.current_screen
                     if self.current_screen == 0:
                         self.current_screen = 2  # Dashboard -> Settings
                     else:
                         self.current_screen = 0  # Settings -> Dashboard
                     last_screen_change = current_time
-                    print(f"Auto-Wechsel zu Screen {self.current_screen}")
+                    if _DEBUG:
+                        print(f"Auto-Wechsel zu Screen {self.current_screen}")
                     if old_screen != self.current_screen:
                         self.screen_needs_redraw = True
                 
-                time.sleep(0.2)  # Längere Pause für weniger Last
+                # Gedrückt oder Loslassen noch nicht bestätigt: im Takt der Entprellzeit
+                # abfragen, erst danach bis zum nächsten Poll auf den Touch-IRQ warten
+                if raw_pressed or committed:
+                    sleep_ms(_TOUCH_DEBOUNCE_MS)
+                    continue
+                
+                # Sonst bis zum nächsten Sensor-Poll bzw. Modus-Timeout schlafen, ein Touch weckt früher
+                if self.manual_mode:
+                    deadline = ticks_add(self.last_touch_time, 60000)
+                else:
+                    deadline = ticks_add(last_screen_change, screen_duration)
+                for t in next_poll.values():
+                    if ticks_diff(t, deadline) < 0:
+                        deadline = t
+                wait_ms = ticks_diff(deadline, ticks_ms())
+                if wait_ms > 0 and not self.screen_needs_redraw:
+                    if touch:
+                        touch.wait_event(wait_ms)
+                    else:
+                        sleep_ms(wait_ms)
                 
         except KeyboardInterrupt:
             print("UI wird beendet...")
@@ -1315,94 +1896,73 @@ class SmartPlantDisplay:
             raise
 
     def update_display_values_only(self):
-        """Aktualisiert nur die Zahlenwerte auf dem Display ohne komplettes Neuzeichnen"""
-        if self.current_screen == 0:  # Main Screen
-            y_start = 20  # Muss mit show_main_screen() übereinstimmen
-            
-            # Temperatur-Wert aktualisieren
-            if abs(self.sensor_data['temperature'] - self.last_displayed_values['temperature']) > 0.1:
-                # Überschreibe alten Wert mit Hintergrundfarbe (größerer Bereich)
-                self.fill_rect(20, y_start + 45, 65, 30, GRAY_LIGHT)
-                # Zeichne neuen Wert
-                self.draw_number(20, y_start + 45, self.sensor_data['temperature'], 2, ORANGE)
-                self.last_displayed_values['temperature'] = self.sensor_data['temperature']
-            
-            # Luftfeuchtigkeit-Wert aktualisieren (neue Position in zweiter Reihe)
-            if abs(self.sensor_data['humidity'] - self.last_displayed_values['humidity']) > 1:
-                self.fill_rect(20, y_start + 135, 65, 30, GRAY_LIGHT)
-                self.draw_number(20, y_start + 135, self.sensor_data['humidity'], 2, BLUE_LIGHT)
-                self.last_displayed_values['humidity'] = self.sensor_data['humidity']
-            
-            # Lichtqualität-Text und Icon aktualisieren
-            if abs(self.sensor_data['light'] - self.last_displayed_values['light']) > 5:
-                light_value = int(self.sensor_data['light'])
-                light_color = self.get_light_quality_color(light_value)
-                light_description = self.get_light_quality_description(light_value)
-                
-                # Clear den gesamten Licht-Widget Bereich (Icon + Text)
-                self.fill_rect(110, y_start, 200, 80, GRAY_LIGHT)  # Gesamte Lichtbox löschen
-                
-                # Icon neu zeichnen mit aktueller Farbe
-                self.draw_icon_sun(120, y_start + 10, 60, light_color)  # 2x größer: 30 -> 60
-                
-                # Text neu zeichnen
-                text_x = 190  # Nach dem Icon (120 + 60 + 10 Pixel Abstand)
-                text_y = y_start + 20  # Vertikal zentriert zum Icon
-                
-                # Neue Beschreibung zeichnen (mit gleicher Logik wie show_main_screen)
-                if len(light_description) > 10:
-                    # Lange Beschreibungen verkürzen oder umbruch
-                    words = light_description.split()
-                    if len(words) >= 2:
-                        self.draw_simple_text_2x(text_x, text_y, words[0], light_color)
-                        self.draw_simple_text_2x(text_x, text_y + 20, words[1], light_color)  # 2x spacing: 10 -> 20
-                    else:
-                        # Zu lang für eine Zeile - verkürzen
-                        short_desc = light_description[:10]
-                        self.draw_simple_text_2x(text_x, text_y, short_desc, light_color)
-                else:
-                    # Kurze Beschreibungen in einer Zeile neben dem Icon
-                    self.draw_simple_text_2x(text_x, text_y, light_description, light_color)
-                
-                self.last_displayed_values['light'] = light_value
-            
-            # Pflanzengesundheit-Balken aktualisieren
-            if abs(self.sensor_data['plant_health'] - self.last_displayed_values['plant_health']) > 1:
-                health = self.sensor_data['plant_health']
-                if health > 80:
-                    status_color = GREEN_LIGHT
-                elif health > 60:
-                    status_color = YELLOW
-                else:
-                    status_color = RED
-                # Nur den Fortschrittsbalken neu zeichnen (angepasste Position)
-                self.draw_progress_bar(120, y_start + 110, 180, 25, health, 100, GRAY_DARK, status_color)
-                self.last_displayed_values['plant_health'] = health
-                
-        elif self.current_screen == 1:  # Detail Screen
-            y = 20  # Muss mit show_detail_screen() übereinstimmen
-            
-            # Temperatur Detail-Wert
-            if abs(self.sensor_data['temperature'] - self.last_displayed_values['temperature']) > 0.1:
-                self.fill_rect(200, y + 5, 80, 30, GRAY_LIGHT)
-                temp_str = f"{self.sensor_data['temperature']:.1f}"
-                self.draw_number(200, y + 5, float(temp_str), 3, ORANGE)
-                self.last_displayed_values['temperature'] = self.sensor_data['temperature']
-            
-            y += 50
-            
-            # Licht Detail
-            if abs(self.sensor_data['light'] - self.last_displayed_values['light']) > 5:
-                light_value = self.sensor_data['light']
-                light_color = self.get_light_quality_color(light_value)
-                light_description = self.get_light_quality_description(light_value)
-                
-                self.draw_progress_bar(70, y + 10, 150, 20, light_value, 1000, GRAY_DARK, light_color)
-                self.fill_rect(230, y + 15, 75, 15, GRAY_LIGHT)
-                self.draw_simple_text(230, y + 15, light_description, light_color)
-                self.last_displayed_values['light'] = light_value
+        """Zeichnet nur die geänderten Widgets neu (Dirty-Rects) statt des ganzen Screens"""
+        widgets = self._widgets.get(self.current_screen)
+        dirty = self.dirty_widgets
+        if widgets:
+            sensor_data = self.sensor_data
+            last_displayed = self.last_displayed_values
+            for key in dirty:
+                entry = widgets.get(key)
+                if entry:
+                    (x, y, w, h), draw, update = entry
+                    # Widgets mit eigenem Update zeichnen wenn möglich nur die Änderung
+                    if update is None or not update():
+                        self.render(draw, x, y, w, h)
+                    if key in sensor_data:
+                        last_displayed[key] = sensor_data[key]
+        dirty.clear()
+
+    def mark_dirty_widgets(self):
+        """Merkt Widgets vor, deren Wert sich seit der letzten Anzeige geändert hat"""
+        sensor_data = self.sensor_data
+        last_displayed = self.last_displayed_values
+        dirty = self.dirty_widgets
+        for key, tolerance in _DIRTY_TOLERANCE.items():
+            if abs(sensor_data[key] - last_displayed[key]) > tolerance:
+                dirty.add(key)
+        for key in _DIRTY_INT_KEYS:
+            if int(sensor_data[key]) != int(last_displayed[key]):
+                dirty.add(key)
+        if dirty:
+            self.data_needs_update = True
 
     def draw_bottom_navigation_bar(self):
+        """Blittet die vorgerenderte Navigation-Bar, rendert sie nur bei Zustandswechsel neu"""
+        nav_height = 40
+        nav_y = self.height - nav_height
+        
+        if self._nav_fb is None:
+            # Der Cache wird wie der Streifen als GS8 gesendet, ohne Streifen also kein Cache
+            self._nav_fb = False
+            if self._strip is not None:
+                try:
+                    self._nav_buf = bytearray(self.width * nav_height)
+                    self._nav_fb = framebuf.FrameBuffer(self._nav_buf, self.width, nav_height, framebuf.GS8)
+                    self._nav_mv = memoryview(self._nav_buf)
+                except MemoryError:
+                    pass
+        if not self._nav_fb:
+            # Kein RAM für den Cache - direkt zeichnen
+            self._draw_bottom_navigation_bar()
+            return
+        
+        if self._nav_key != self.current_screen:
+            # Zeichenziel kurz auf den Cache umlenken
+            target = (self._fb, self._fb_x, self._fb_y)
+            self._fb, self._fb_x, self._fb_y = self._nav_fb, 0, nav_y
+            try:
+                self._draw_bottom_navigation_bar()
+            finally:
+                self._fb, self._fb_x, self._fb_y = target
+            self._nav_key = self.current_screen
+        
+        if self._fb:
+            self._fb.blit(self._nav_fb, -self._fb_x, nav_y - self._fb_y)
+        else:
+            self._flush_indexed(self._nav_mv, 0, nav_y, self.width, nav_height)
+
+    def _draw_bottom_navigation_bar(self):
         """Zeichnet die Touch-Navigation-Bar am unteren Bildschirmrand"""
         nav_height = 40
         nav_y = self.height - nav_height
@@ -1459,29 +2019,11 @@ class SmartPlantDisplay:
 
     def get_light_quality_description(self, light_value):
         """Konvertiert Lichtwerte in qualitative Beschreibungen"""
-        if light_value >= 800:
-            return "EXCELLENT"
-        elif light_value >= 600:
-            return "VERY GOOD"
-        elif light_value >= 400:
-            return "GOOD"
-        elif light_value >= 200:
-            return "POOR"
-        else:
-            return "VERY POOR"
+        return _light_band(light_value)[1]
 
     def get_light_quality_color(self, light_value):
         """Gibt passende Farbe für Lichtqualität zurück"""
-        if light_value >= 800:
-            return GREEN_LIGHT  # Excellent
-        elif light_value >= 600:
-            return YELLOW  # Very Good
-        elif light_value >= 400:
-            return ORANGE  # Good
-        elif light_value >= 200:
-            return RED  # Poor
-        else:
-            return GRAY_DARK  # Very Poor
+        return _light_band(light_value)[0]
 
 def main():
     print("=== Smart Plant UI mit Touch ===")
@@ -1497,11 +2039,12 @@ def main():
     
     # SPI-Konfiguration für Display (SPI 0)
     display_spi = machine.SPI(0, 
-                      baudrate=20000000,
+                      baudrate=DISPLAY_SPI_BAUDRATE,
                       polarity=0, 
                       phase=0)
     
     # Software-SPI für Touch (BitBang) - exakt Ihre Hardware-Pins
+    # Eigener Bus: SPI 0 bleibt fest auf dem Display-Takt und muss nie umkonfiguriert werden
     # Definiere Touch-Pins (exakt wie Sie sie verkabelt haben)
     touch_sck = machine.Pin(2, machine.Pin.OUT)   # T_CLK = GP2
     touch_mosi = machine.Pin(3, machine.Pin.OUT)  # T_DIN = GP3  
@@ -1521,7 +2064,7 @@ def main():
     touch = TouchController(touch_spi, touch_cs_pin, touch_irq_pin)
     
     # Display erstellen und initialisieren
-    plant_ui = SmartPlantDisplay(display_spi, dc_pin, reset_pin, cs_pin, touch)
+    plant_ui = SmartPlantDisplay(display_spi, dc_pin, reset_pin, cs_pin, touch, spi_id=0)
     plant_ui.init()
     
     print("Touch-Controller konfiguriert:")